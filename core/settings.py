@@ -199,6 +199,10 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticatedOrReadOnly",
     ],
+    "DEFAULT_RENDERER_CLASSES": [
+        "drf_orjson_renderer.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 12,
     "DEFAULT_FILTER_BACKENDS": [
@@ -324,6 +328,11 @@ CACHE_TTL = {
     "CONNECTION_REQUESTS": 300,  # 5 minutes
     "USER_CONNECTIONS": 600,  # 10 minutes
     "ACCEPTED_CONNECTIONS": 600,  # 10 minutes
+    "GROUP_MEMBERSHIP_ROLE": 60,  # 1 minute
+    "GROUP_RESPONSES": 30,  # 30 seconds
+    "LEARNING_LISTS": 60,  # 1 minute
+    "SUBJECT_COUNTS": 300,  # 5 minutes
+    "PAGINATION_COUNTS": 300,  # 5 minutes
 }
 
 # Django Channels configuration
@@ -5,3 +5,6 @@ class GroupsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'groups'
     verbose_name = 'Study Groups'
+
+    def ready(self):
+        from . import signals  # noqa: F401
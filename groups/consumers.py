@@ -6,7 +6,8 @@ import logging
 from channels.generic.websocket import AsyncWebsocketConsumer
 from channels.db import database_sync_to_async
 from django.utils import timezone
-from groups.models import StudyGroup, GroupConversation, GroupMessage, GroupMessageRead
+from groups.models import GroupConversation, GroupMessage, GroupMessageRead
+from groups.services import GroupMembershipCacheService
 
 logger = logging.getLogger(__name__)
 
@@ -40,9 +41,9 @@ class GroupChatConsumer(AsyncWebsocketConsumer):
             await self.close(code=4001)
             return
 
-        # Check if user is a member of the group
-        is_member = await self.check_member()
-        if not is_member:
+        # Check if user is a member of the group (role is cached for later messages)
+        self.scope['membership_role'] = await self.get_membership_role()
+        if not self.scope['membership_role']:
             logger.warning(f"WebSocket rejected: User {self.user.id} not member of group {self.group_id}")
             await self.close(code=4003)
             return
@@ -232,16 +233,22 @@ class GroupChatConsumer(AsyncWebsocketConsumer):
         }))
 
     # Database operations (sync functions wrapped with database_sync_to_async)
+    def get_conversation(self):
+        """
+        Get the group's conversation, fetched once per connection.
+        Must be called from a sync database operation.
+        """
+        if getattr(self, 'conversation', None) is None:
+            self.conversation, created = GroupConversation.objects.get_or_create(group_id=self.group_id)
+        return self.conversation
+
     @database_sync_to_async
-    def check_member(self):
+    def get_membership_role(self):
         """
-        Check if user is a member of the group.
+        Get the user's active role in the group (None if not a member).
+        Served from the membership cache, so repeated checks don't hit the database.
         """
-        try:
-            group = StudyGroup.objects.get(pk=self.group_id)
-            return group.is_member(self.user)
-        except StudyGroup.DoesNotExist:
-            return False
+        return GroupMembershipCacheService.get_role(self.group_id, self.user.id)
 
     @database_sync_to_async
     def save_message(self, content):
@@ -249,14 +256,9 @@ class GroupChatConsumer(AsyncWebsocketConsumer):
         Save message to database.
         """
         try:
-            group = StudyGroup.objects.get(pk=self.group_id)
-
-            # Get or create conversation
-            conversation, created = GroupConversation.objects.get_or_create(group=group)
-
             # Create message
             message = GroupMessage.objects.create(
-                conversation=conversation,
+                conversation=self.get_conversation(),
                 sender=self.user,
                 content=content
             )
@@ -274,25 +276,24 @@ class GroupChatConsumer(AsyncWebsocketConsumer):
         """
         try:
             # Filter message IDs to only those in this group's conversation
-            group = StudyGroup.objects.get(pk=self.group_id)
-            conversation = group.conversation
+            conversation = self.get_conversation()
 
-            valid_messages = GroupMessage.objects.filter(
+            valid_message_ids = GroupMessage.objects.filter(
                 id__in=message_ids,
                 conversation=conversation
             ).exclude(
                 sender=self.user  # Don't mark own messages as read
-            )
+            ).exclude(
+                read_by__user=self.user  # Skip messages already read
+            ).values_list('id', flat=True)
 
             # Bulk create read records (ignore conflicts if already read)
-            read_records = []
-            for message in valid_messages:
-                if not GroupMessageRead.objects.filter(message=message, user=self.user).exists():
-                    read_records.append(
-                        GroupMessageRead(message=message, user=self.user)
-                    )
-
-            GroupMessageRead.objects.bulk_create(read_records, ignore_conflicts=True)
+            read_records = [
+                GroupMessageRead(message_id=message_id, user=self.user)
+                for message_id in valid_message_ids
+            ]
+
+            GroupMessageRead.objects.bulk_create(read_records, ignore_conflicts=True, batch_size=500)
 
             return len(read_records)
         except Exception as e:
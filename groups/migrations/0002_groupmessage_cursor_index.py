@@ -0,0 +1,21 @@
+# Generated by Django 5.2.7 on 2026-10-15 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('groups', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='groupmessage',
+            name='group_messa_convers_638124_idx',
+        ),
+        migrations.AddIndex(
+            model_name='groupmessage',
+            index=models.Index(fields=['conversation', '-created_at', '-id'], name='group_messa_convers_d51ac3_idx'),
+        ),
+    ]
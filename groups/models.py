@@ -78,9 +78,20 @@ class StudyGroup(models.Model):
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        """Override save to create the group's conversation alongside a new group"""
+        is_new = self.pk is None
+
+        super().save(*args, **kwargs)
+
+        if is_new:
+            GroupConversation.objects.create(group=self)
+
     @property
     def member_count(self):
-        """Get current number of active members"""
+        """Get current number of active members (uses `active_member_count` annotation if present)"""
+        if hasattr(self, 'active_member_count'):
+            return self.active_member_count
         return self.memberships.filter(status=GroupMembership.STATUS_ACTIVE).count()
 
     @property
@@ -98,28 +109,30 @@ class StudyGroup(models.Model):
             group_memberships__status=GroupMembership.STATUS_ACTIVE
         )
 
+    def get_active_role(self, user):
+        """
+        Get user's role if they are an active member, else None.
+        Memoized on the instance so repeated checks within a request share one query.
+        """
+        active_roles = self.__dict__.setdefault('_active_roles', {})
+        if user.pk not in active_roles:
+            active_roles[user.pk] = self.memberships.filter(
+                user=user,
+                status=GroupMembership.STATUS_ACTIVE
+            ).values_list('role', flat=True).first()
+        return active_roles[user.pk]
+
     def is_admin(self, user):
         """Check if user is an admin of the group"""
-        return self.memberships.filter(
-            user=user,
-            role=GroupMembership.ROLE_ADMIN,
-            status=GroupMembership.STATUS_ACTIVE
-        ).exists()
+        return self.get_active_role(user) == GroupMembership.ROLE_ADMIN
 
     def is_moderator(self, user):
         """Check if user is a moderator (or admin) of the group"""
-        return self.memberships.filter(
-            user=user,
-            role__in=[GroupMembership.ROLE_ADMIN, GroupMembership.ROLE_MODERATOR],
-            status=GroupMembership.STATUS_ACTIVE
-        ).exists()
+        return self.get_active_role(user) in [GroupMembership.ROLE_ADMIN, GroupMembership.ROLE_MODERATOR]
 
     def is_member(self, user):
         """Check if user is an active member"""
-        return self.memberships.filter(
-            user=user,
-            status=GroupMembership.STATUS_ACTIVE
-        ).exists()
+        return self.get_active_role(user) is not None
 
     def can_join(self, user):
         """Check if a user can join the group"""
@@ -261,8 +274,9 @@ class GroupConversation(models.Model):
         return f"Conversation for {self.group.name}"
 
     def is_participant(self, user):
-        """Check if user is an active member of the group"""
-        return self.group.is_member(user)
+        """Check if user is an active member of the group (cached role lookup)"""
+        from groups.services import GroupMembershipCacheService
+        return GroupMembershipCacheService.get_role(self.group_id, user.pk) is not None
 
 
 class GroupMessage(models.Model):
@@ -283,7 +297,7 @@ class GroupMessage(models.Model):
         db_table = 'group_messages'
         ordering = ['created_at']
         indexes = [
-            models.Index(fields=['conversation', 'created_at']),
+            models.Index(fields=['conversation', '-created_at', '-id']),
             models.Index(fields=['sender']),
         ]
 
@@ -0,0 +1,178 @@
+"""
+OpenAPI schema definitions for groups endpoints.
+"""
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from drf_spectacular.types import OpenApiTypes
+from groups.serializers import (
+    StudyGroupListSerializer,
+    StudyGroupDetailSerializer,
+    CreateStudyGroupSerializer,
+    GroupMembershipSerializer,
+    JoinGroupSerializer,
+    InviteUserSerializer,
+    UpdateMemberRoleSerializer,
+    GroupMessageSerializer,
+    CreateGroupMessageSerializer,
+    MarkMessagesReadSerializer,
+)
+
+
+# Shared query parameters
+PAGE_PARAMETER = OpenApiParameter(
+    name='page',
+    type=OpenApiTypes.INT,
+    description='Page number for pagination (default: 1)'
+)
+
+SUBJECT_PARAMETER = OpenApiParameter(
+    name='subject',
+    type=OpenApiTypes.INT,
+    description='Filter by subject ID'
+)
+
+MESSAGE_RESPONSE = {200: {'message': 'string'}}
+
+
+# Study group schemas
+study_group_create_schema = extend_schema(
+    request=CreateStudyGroupSerializer,
+    responses={201: StudyGroupDetailSerializer},
+    description="Create a new study group"
+)
+
+study_group_list_schema = extend_schema(
+    parameters=[
+        OpenApiParameter(
+            name='status',
+            type=OpenApiTypes.STR,
+            enum=['active', 'inactive', 'archived'],
+            description='Filter by group status'
+        ),
+        OpenApiParameter(
+            name='privacy',
+            type=OpenApiTypes.STR,
+            enum=['public', 'private', 'invite_only'],
+            description='Filter by privacy setting'
+        ),
+        SUBJECT_PARAMETER,
+        OpenApiParameter(
+            name='school',
+            type=OpenApiTypes.INT,
+            description='Filter by school ID'
+        ),
+    ],
+    responses={200: StudyGroupListSerializer(many=True)},
+    description="List all study groups with optional filters"
+)
+
+study_group_destroy_schema = extend_schema(
+    description="Delete a study group (admin only)"
+)
+
+study_group_join_schema = extend_schema(
+    request=JoinGroupSerializer,
+    responses={200: GroupMembershipSerializer},
+    description="Join or request to join a study group"
+)
+
+study_group_leave_schema = extend_schema(
+    responses=MESSAGE_RESPONSE,
+    description="Leave a study group"
+)
+
+study_group_invite_schema = extend_schema(
+    request=InviteUserSerializer,
+    responses={200: GroupMembershipSerializer},
+    description="Invite a user to join the group (admin/moderator only)"
+)
+
+study_group_members_schema = extend_schema(
+    parameters=[
+        PAGE_PARAMETER,
+        OpenApiParameter(
+            name='page_size',
+            type=OpenApiTypes.INT,
+            description='Number of results per page (default: 12, max: 100)'
+        ),
+    ],
+    responses={200: GroupMembershipSerializer(many=True)},
+    description="List all members of the group (paginated)"
+)
+
+study_group_my_groups_schema = extend_schema(
+    parameters=[PAGE_PARAMETER],
+    responses={200: StudyGroupListSerializer(many=True)},
+    description="List groups the current user is a member of (paginated)"
+)
+
+study_group_nearby_schema = extend_schema(
+    parameters=[
+        OpenApiParameter(
+            name='radius_km',
+            type=OpenApiTypes.FLOAT,
+            description='Search radius in kilometers (default: 10km)'
+        ),
+        SUBJECT_PARAMETER,
+    ],
+    responses={200: StudyGroupListSerializer(many=True)},
+    description="Find nearby study groups"
+)
+
+
+# Group membership schemas
+membership_retrieve_schema = extend_schema(
+    responses={200: GroupMembershipSerializer},
+    description="Get membership details"
+)
+
+membership_role_schema = extend_schema(
+    request=UpdateMemberRoleSerializer,
+    responses={200: GroupMembershipSerializer},
+    description="Update a member's role (admin only)"
+)
+
+membership_accept_schema = extend_schema(
+    responses={200: GroupMembershipSerializer},
+    description="Accept a join request (admin only)"
+)
+
+membership_reject_schema = extend_schema(
+    responses=MESSAGE_RESPONSE,
+    description="Reject a join request (admin only)"
+)
+
+membership_remove_schema = extend_schema(
+    responses=MESSAGE_RESPONSE,
+    description="Remove a member from the group (admin only)"
+)
+
+
+# Group message schemas
+group_message_list_schema = extend_schema(
+    parameters=[
+        OpenApiParameter(
+            name='cursor',
+            type=OpenApiTypes.STR,
+            description='Opaque cursor taken from the `next`/`previous` links'
+        ),
+        OpenApiParameter(
+            name='page_size',
+            type=OpenApiTypes.INT,
+            description='Number of messages per page (default: 50, max: 100)'
+        ),
+    ],
+    responses={200: GroupMessageSerializer(many=True)},
+    description="List group messages with cursor pagination (newest first)"
+)
+
+group_message_create_schema = extend_schema(
+    request=CreateGroupMessageSerializer,
+    responses={201: GroupMessageSerializer},
+    description="Send a message to the group"
+)
+
+group_message_mark_read_schema = extend_schema(
+    request=MarkMessagesReadSerializer,
+    responses=MESSAGE_RESPONSE,
+    description="Mark messages as read"
+)
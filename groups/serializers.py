@@ -5,7 +5,7 @@ from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from django.contrib.gis.geos import Point
 
-from .models import StudyGroup, GroupMembership, GroupConversation, GroupMessage, GroupMessageRead
+from .models import StudyGroup, GroupMembership, GroupMessage, GroupMessageRead
 from learning.models import Subject
 from locations.models import School
 
@@ -121,15 +121,81 @@ class StudyGroupListSerializer(serializers.ModelSerializer):
         """Get current user's role in the group."""
         request = self.context.get('request')
         if request and request.user.is_authenticated:
-            membership = obj.memberships.filter(
-                user=request.user,
-                status=GroupMembership.STATUS_ACTIVE
-            ).first()
-            if membership:
-                return membership.role
+            return obj.get_active_role(request.user)
         return None
 
 
+class StudyGroupRowSerializer(serializers.Serializer):
+    """
+    Read-only serializer for study group `values()` rows (lightweight).
+    Produces the same output as StudyGroupListSerializer without hydrating model instances.
+
+    Rows must contain ROW_FIELDS plus `active_member_count`, `user_role` and a `subjects` list.
+    """
+
+    ROW_FIELDS = (
+        'id', 'name', 'description', 'avatar_url', 'privacy', 'max_members', 'status', 'created_at',
+        'created_by__id', 'created_by__email', 'created_by__full_name', 'created_by__avatar_url',
+        'created_by__school', 'created_by__major', 'created_by__year',
+        'school__id', 'school__name', 'school__short_name',
+    )
+
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    description = serializers.CharField()
+    avatar_url = serializers.CharField(allow_null=True)
+    created_by = serializers.SerializerMethodField()
+    school = serializers.SerializerMethodField()
+    subjects = serializers.ListField(child=serializers.DictField())
+    privacy = serializers.CharField()
+    member_count = serializers.IntegerField(source='active_member_count')
+    max_members = serializers.IntegerField(allow_null=True)
+    is_full = serializers.SerializerMethodField()
+    status = serializers.CharField()
+    is_member = serializers.SerializerMethodField()
+    is_admin = serializers.SerializerMethodField()
+    user_role = serializers.CharField(allow_null=True)
+    created_at = serializers.DateTimeField()
+
+    def get_created_by(self, row):
+        """Build creator info from flattened columns."""
+        if row['created_by__id'] is None:
+            return None
+        return {
+            'id': row['created_by__id'],
+            'email': row['created_by__email'],
+            'full_name': row['created_by__full_name'],
+            'avatar_url': row['created_by__avatar_url'],
+            'school': row['created_by__school'],
+            'major': row['created_by__major'],
+            'year': row['created_by__year'],
+        }
+
+    def get_school(self, row):
+        """Build school info from flattened columns."""
+        if row['school__id'] is None:
+            return None
+        return {
+            'id': row['school__id'],
+            'name': row['school__name'],
+            'short_name': row['school__short_name'],
+        }
+
+    def get_is_full(self, row):
+        """Check if group has reached max capacity."""
+        if row['max_members'] is None:
+            return False
+        return row['active_member_count'] >= row['max_members']
+
+    def get_is_member(self, row):
+        """Check if current user is a member."""
+        return row['user_role'] is not None
+
+    def get_is_admin(self, row):
+        """Check if current user is an admin."""
+        return row['user_role'] == GroupMembership.ROLE_ADMIN
+
+
 class StudyGroupDetailSerializer(serializers.ModelSerializer):
     """Serializer for study group detail view (complete)."""
 
@@ -267,12 +333,7 @@ class StudyGroupDetailSerializer(serializers.ModelSerializer):
         """Get current user's role in the group."""
         request = self.context.get('request')
         if request and request.user.is_authenticated:
-            membership = obj.memberships.filter(
-                user=request.user,
-                status=GroupMembership.STATUS_ACTIVE
-            ).first()
-            if membership:
-                return membership.role
+            return obj.get_active_role(request.user)
         return None
 
     def get_user_membership_status(self, obj):
@@ -338,9 +399,6 @@ class CreateStudyGroupSerializer(serializers.ModelSerializer):
             status=GroupMembership.STATUS_ACTIVE
         )
 
-        # Create group conversation
-        GroupConversation.objects.create(group=group)
-
         return group
 
 
@@ -0,0 +1,155 @@
+"""
+Service layer for groups app with Redis caching.
+"""
+from django.core.cache import cache
+from django.conf import settings
+from django.db import transaction
+from typing import Callable, Optional
+from urllib.parse import urlencode
+import hashlib
+import time
+
+from .models import GroupMembership
+
+
+class GroupMembershipCacheService:
+    """Service for caching active group membership roles in Redis."""
+
+    # Cache key prefixes
+    MEMBERSHIP_ROLE_KEY = "group:{group_id}:member:{user_id}:role"
+
+    # Cached value for users without an active membership
+    # (None can't be used since it is indistinguishable from a cache miss)
+    NOT_MEMBER = ""
+
+    @classmethod
+    def _get_cache_timeout(cls) -> int:
+        """Get cache timeout for membership roles."""
+        cache_ttl = getattr(settings, 'CACHE_TTL', {})
+        return cache_ttl.get('GROUP_MEMBERSHIP_ROLE', 60)
+
+    @classmethod
+    def get_role(cls, group_id: int, user_id: int) -> Optional[str]:
+        """
+        Get the user's active role in a group.
+        Falls back to the database on a cache miss and caches the result.
+        Returns None if the user is not an active member.
+        """
+        key = cls.MEMBERSHIP_ROLE_KEY.format(group_id=group_id, user_id=user_id)
+        role = cache.get(key)
+
+        if role is None:
+            role = GroupMembership.objects.filter(
+                group_id=group_id,
+                user_id=user_id,
+                status=GroupMembership.STATUS_ACTIVE
+            ).values_list('role', flat=True).first() or cls.NOT_MEMBER
+            cache.set(key, role, cls._get_cache_timeout())
+
+        return role or None
+
+    @classmethod
+    def invalidate(cls, group_id: int, user_id: int) -> None:
+        """Invalidate cached role for a membership."""
+        key = cls.MEMBERSHIP_ROLE_KEY.format(group_id=group_id, user_id=user_id)
+        cache.delete(key)
+
+    @classmethod
+    def invalidate_on_commit(cls, group_id: int, user_id: int) -> None:
+        """
+        Invalidate cached role and rendered responses for a membership once the
+        current transaction commits, so concurrent readers can't re-cache uncommitted state.
+        """
+        def invalidate():
+            cls.invalidate(group_id, user_id)
+            GroupResponseCacheService.invalidate_group(group_id)
+
+        transaction.on_commit(invalidate)
+
+
+class GroupResponseCacheService:
+    """
+    Service for caching rendered JSON of per-user group list responses in Redis.
+
+    Keys embed a generation counter instead of being deleted by pattern:
+    a write bumps the counter with INCR and later reads simply miss, so
+    invalidation never scans the keyspace. Old entries expire with their TTL.
+    """
+
+    # Cache key prefixes
+    RESPONSE_KEY = "group_response:{view_name}:{generation}:{user_id}:{params_hash}"
+    # Generation of the group lists (list, my_groups). Every list shows member
+    # counts and group details, so any group or membership write bumps it
+    LISTS_GENERATION_KEY = "group_response:lists:generation"
+    # Generation of one group's member list
+    GROUP_GENERATION_KEY = "group_response:group:{group_id}:generation"
+
+    # View names whose responses hold a single group's data (e.g. "members:12")
+    GROUP_VIEW_PREFIX = "members:"
+
+    @classmethod
+    def _get_cache_timeout(cls) -> int:
+        """Get cache timeout for rendered responses."""
+        cache_ttl = getattr(settings, 'CACHE_TTL', {})
+        return cache_ttl.get('GROUP_RESPONSES', 30)
+
+    @classmethod
+    def _hash_params(cls, query_params) -> str:
+        """Build a stable hash of request query parameters."""
+        encoded = urlencode(sorted(query_params.lists()), doseq=True)
+        return hashlib.md5(encoded.encode()).hexdigest()
+
+    @classmethod
+    def _get_generation(cls, key: str) -> int:
+        """
+        Get a generation counter, starting it if missing.
+        A fresh counter starts at the current time rather than 0, so a counter
+        lost to eviction can't line up with responses cached before it.
+        """
+        generation = cache.get(key)
+        if generation is None:
+            cache.add(key, time.time_ns(), None)
+            generation = cache.get(key)
+        return generation
+
+    @classmethod
+    def _bump_generation(cls, key: str) -> None:
+        """Advance a generation counter, orphaning the responses keyed on it."""
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Missing counter: nothing can be cached under it yet
+            cache.add(key, time.time_ns(), None)
+
+    @classmethod
+    def _generation_key(cls, view_name: str) -> str:
+        """Generation counter a view's responses are keyed on."""
+        if view_name.startswith(cls.GROUP_VIEW_PREFIX):
+            group_id = view_name[len(cls.GROUP_VIEW_PREFIX):]
+            return cls.GROUP_GENERATION_KEY.format(group_id=group_id)
+        return cls.LISTS_GENERATION_KEY
+
+    @classmethod
+    def get_or_render(cls, view_name: str, user_id: int, query_params, render: Callable[[], bytes]) -> bytes:
+        """Get cached response bytes, rendering and caching them on a miss."""
+        key = cls.RESPONSE_KEY.format(
+            view_name=view_name,
+            generation=cls._get_generation(cls._generation_key(view_name)),
+            user_id=user_id,
+            params_hash=cls._hash_params(query_params)
+        )
+        return cache.get_or_set(key, render, cls._get_cache_timeout())
+
+    @classmethod
+    def invalidate_group(cls, group_id: int) -> None:
+        """
+        Invalidate responses affected by a change to a group or its memberships
+        (join, leave, role change, update, archive).
+        """
+        cls._bump_generation(cls.LISTS_GENERATION_KEY)
+        cls._bump_generation(cls.GROUP_GENERATION_KEY.format(group_id=group_id))
+
+    @classmethod
+    def invalidate_group_on_commit(cls, group_id: int) -> None:
+        """Invalidate a group's responses once the current transaction commits."""
+        transaction.on_commit(lambda: cls.invalidate_group(group_id))
@@ -0,0 +1,22 @@
+"""
+Signal handlers for groups app.
+"""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import GroupMembership, StudyGroup
+from .services import GroupMembershipCacheService, GroupResponseCacheService
+
+
+@receiver(post_save, sender=GroupMembership)
+@receiver(post_delete, sender=GroupMembership)
+def invalidate_membership_cache(sender, instance, **kwargs):
+    """Drop cached membership role and rendered responses whenever a membership changes."""
+    GroupMembershipCacheService.invalidate_on_commit(instance.group_id, instance.user_id)
+
+
+@receiver(post_save, sender=StudyGroup)
+@receiver(post_delete, sender=StudyGroup)
+def invalidate_group_responses(sender, instance, **kwargs):
+    """Drop cached group list responses whenever a group is created, updated or deleted."""
+    GroupResponseCacheService.invalidate_group_on_commit(instance.pk)
@@ -5,17 +5,23 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.pagination import PageNumberPagination, CursorPagination
+from drf_orjson_renderer.renderers import ORJSONRenderer
+from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.functional import cached_property
 from django.db import models, transaction
+from django.utils import timezone
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Coalesce
 from django.contrib.auth import get_user_model
-from django.contrib.gis.db.models.functions import Distance
 from django.contrib.gis.measure import D
-from drf_spectacular.utils import extend_schema, OpenApiParameter
-from drf_spectacular.types import OpenApiTypes
 
 from .models import StudyGroup, GroupMembership, GroupConversation, GroupMessage, GroupMessageRead
+from .services import GroupMembershipCacheService, GroupResponseCacheService
 from .serializers import (
     StudyGroupListSerializer,
+    StudyGroupRowSerializer,
     StudyGroupDetailSerializer,
     CreateStudyGroupSerializer,
     UpdateStudyGroupSerializer,
@@ -27,6 +33,25 @@ from .serializers import (
     CreateGroupMessageSerializer,
     MarkMessagesReadSerializer,
 )
+from .schema import (
+    study_group_create_schema,
+    study_group_list_schema,
+    study_group_destroy_schema,
+    study_group_join_schema,
+    study_group_leave_schema,
+    study_group_invite_schema,
+    study_group_members_schema,
+    study_group_my_groups_schema,
+    study_group_nearby_schema,
+    membership_retrieve_schema,
+    membership_role_schema,
+    membership_accept_schema,
+    membership_reject_schema,
+    membership_remove_schema,
+    group_message_list_schema,
+    group_message_create_schema,
+    group_message_mark_read_schema,
+)
 from .permissions import (
     IsGroupAdmin,
     IsGroupModerator,
@@ -40,6 +65,70 @@ from .permissions import (
 User = get_user_model()
 
 
+class GroupMessagePagination(CursorPagination):
+    """
+    Keyset pagination for group chat messages (newest first).
+    Avoids COUNT(*) and deep OFFSET scans as conversations grow.
+    """
+    ordering = ('-created_at', '-id')
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+# Columns read by UserBasicSerializer, for .only() projections through a relation
+USER_BASIC_FIELDS = ('id', 'email', 'full_name', 'avatar_url', 'school', 'major', 'year')
+
+# Columns read by StudyGroupListSerializer
+STUDY_GROUP_LIST_FIELDS = (
+    'id', 'name', 'description', 'avatar_url', 'privacy', 'max_members', 'status', 'created_at',
+    'school__id', 'school__name', 'school__short_name',
+    *(f'created_by__{field}' for field in USER_BASIC_FIELDS),
+)
+
+# Columns read by GroupMembershipSerializer
+GROUP_MEMBERSHIP_FIELDS = (
+    'id', 'role', 'status', 'joined_at', 'updated_at', 'left_at',
+    *(f'user__{field}' for field in USER_BASIC_FIELDS),
+    *(f'invited_by__{field}' for field in USER_BASIC_FIELDS),
+)
+
+# Active member count annotation, read by StudyGroup.member_count / is_full
+ACTIVE_MEMBER_COUNT = models.Count(
+    'memberships',
+    filter=models.Q(memberships__status=GroupMembership.STATUS_ACTIVE)
+)
+
+
+def active_membership_count(group_ref, **filters):
+    """
+    Count active memberships of the outer query's group as a correlated subquery.
+    Usable where GROUP BY isn't (FOR UPDATE locks, KNN index ordering).
+    """
+    return Coalesce(
+        models.Subquery(
+            GroupMembership.objects.filter(
+                group=models.OuterRef(group_ref),
+                status=GroupMembership.STATUS_ACTIVE,
+                **filters
+            ).order_by().values('group').annotate(
+                count=models.Count('pk')
+            ).values('count')[:1]
+        ),
+        0
+    )
+
+
+# Same count as a correlated subquery on StudyGroup querysets
+ACTIVE_MEMBER_COUNT_SUBQUERY = active_membership_count('pk')
+
+# Active admin count of a membership's group, for the last-admin guard
+GROUP_ADMIN_COUNT_SUBQUERY = active_membership_count('group', role=GroupMembership.ROLE_ADMIN)
+
+# Upper bound on results returned by the nearby search
+NEARBY_MAX_RESULTS = 100
+
+
 class StudyGroupViewSet(viewsets.ModelViewSet):
     """
     ViewSet for managing study groups.
@@ -85,6 +174,19 @@ class StudyGroupViewSet(viewsets.ModelViewSet):
             return [IsAuthenticated(), IsGroupModerator()]
         return [IsAuthenticated()]
 
+    def _cached_json_response(self, view_name, build_data):
+        """
+        Return rendered JSON from the short-lived per-user response cache.
+        On a miss, `build_data` is called and its result rendered and cached.
+        """
+        content = GroupResponseCacheService.get_or_render(
+            view_name,
+            self.request.user.id,
+            self.request.query_params,
+            lambda: ORJSONRenderer().render(build_data())
+        )
+        return HttpResponse(content, content_type='application/json')
+
     def get_queryset(self):
         """
         Filter queryset based on query parameters.
@@ -93,16 +195,27 @@ class StudyGroupViewSet(viewsets.ModelViewSet):
         queryset = StudyGroup.objects.select_related(
             'created_by', 'school'
         ).prefetch_related(
-            'subjects', 'memberships__user'
+            'subjects'
+        ).annotate(
+            active_member_count=ACTIVE_MEMBER_COUNT
         )
 
+        # Only fetch the columns the list serializer reads
+        if self.action == 'list':
+            queryset = queryset.only(*STUDY_GROUP_LIST_FIELDS)
+
         # Filter by privacy (exclude invite-only groups user is not a member of)
+        # (EXISTS semi-join avoids duplicated rows and a DISTINCT over the full row)
         if self.action == 'list':
-            queryset = queryset.exclude(
-                privacy=StudyGroup.PRIVACY_INVITE_ONLY
-            ) | queryset.filter(
-                memberships__user=user,
-                memberships__status=GroupMembership.STATUS_ACTIVE
+            is_active_member = models.Exists(
+                GroupMembership.objects.filter(
+                    group=models.OuterRef('pk'),
+                    user=user,
+                    status=GroupMembership.STATUS_ACTIVE
+                )
+            )
+            queryset = queryset.filter(
+                ~models.Q(privacy=StudyGroup.PRIVACY_INVITE_ONLY) | is_active_member
             )
 
         # Filter by status
@@ -128,18 +241,26 @@ class StudyGroupViewSet(viewsets.ModelViewSet):
         if school_id:
             queryset = queryset.filter(school_id=school_id)
 
-        return queryset.distinct().order_by('-created_at')
+        return queryset.order_by('-created_at')
 
-    @extend_schema(
-        request=CreateStudyGroupSerializer,
-        responses={201: StudyGroupDetailSerializer},
-        description="Create a new study group"
-    )
+    @study_group_create_schema
     def create(self, request, *args, **kwargs):
         """Create a new study group."""
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        group = serializer.save()
+
+        # Group, subjects, admin membership and conversation are created together
+        with transaction.atomic():
+            group = serializer.save()
+
+        # Refetch once with relations loaded so the detail serializer doesn't lazy-load them
+        group = StudyGroup.objects.select_related(
+            'created_by', 'school'
+        ).prefetch_related(
+            'subjects'
+        ).annotate(
+            active_member_count=ACTIVE_MEMBER_COUNT
+        ).get(pk=group.pk)
 
         response_serializer = StudyGroupDetailSerializer(
             group,
@@ -147,114 +268,108 @@ class StudyGroupViewSet(viewsets.ModelViewSet):
         )
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
 
-    @extend_schema(
-        parameters=[
-            OpenApiParameter(
-                name='status',
-                type=OpenApiTypes.STR,
-                enum=['active', 'inactive', 'archived'],
-                description='Filter by group status'
-            ),
-            OpenApiParameter(
-                name='privacy',
-                type=OpenApiTypes.STR,
-                enum=['public', 'private', 'invite_only'],
-                description='Filter by privacy setting'
-            ),
-            OpenApiParameter(
-                name='subject',
-                type=OpenApiTypes.INT,
-                description='Filter by subject ID'
-            ),
-            OpenApiParameter(
-                name='school',
-                type=OpenApiTypes.INT,
-                description='Filter by school ID'
-            ),
-        ],
-        responses={200: StudyGroupListSerializer(many=True)},
-        description="List all study groups with optional filters"
-    )
+    @study_group_list_schema
     def list(self, request, *args, **kwargs):
         """List study groups."""
-        return super().list(request, *args, **kwargs)
+        return self._cached_json_response(
+            'list',
+            lambda: super(StudyGroupViewSet, self).list(request, *args, **kwargs).data
+        )
 
-    @extend_schema(
-        description="Delete a study group (admin only)"
-    )
+    @study_group_destroy_schema
     def destroy(self, request, *args, **kwargs):
         """Delete (archive) a group."""
         instance = self.get_object()
-        instance.status = StudyGroup.STATUS_ARCHIVED
-        instance.save(update_fields=['status', 'updated_at'])
+        # Single UPDATE without reloading/saving the instance
+        StudyGroup.objects.filter(pk=instance.pk).update(
+            status=StudyGroup.STATUS_ARCHIVED,
+            updated_at=timezone.now()
+        )
+        # update() skips post_save, so invalidate cached responses explicitly
+        GroupResponseCacheService.invalidate_group_on_commit(instance.pk)
         return Response(
             {'message': 'Group archived successfully.'},
             status=status.HTTP_200_OK
         )
 
-    @extend_schema(
-        request=JoinGroupSerializer,
-        responses={200: GroupMembershipSerializer},
-        description="Join or request to join a study group"
-    )
+    @study_group_join_schema
     @action(detail=True, methods=['post'])
     def join(self, request, pk=None):
         """Join or request to join a group."""
-        group = self.get_object()
-
-        # Check if already a member
-        if group.is_member(request.user):
-            return Response(
-                {'error': 'You are already a member of this group.'},
-                status=status.HTTP_400_BAD_REQUEST
+        with transaction.atomic():
+            # Lock the group row and fetch member count + own membership status in one query
+            group = get_object_or_404(
+                StudyGroup.objects.select_for_update().filter(
+                    status=StudyGroup.STATUS_ACTIVE
+                ).annotate(
+                    active_member_count=ACTIVE_MEMBER_COUNT_SUBQUERY,
+                    my_membership_status=models.Subquery(
+                        GroupMembership.objects.filter(
+                            group=models.OuterRef('pk'),
+                            user=request.user
+                        ).values('status')[:1]
+                    )
+                ),
+                pk=pk
             )
+            self.check_object_permissions(request, group)
 
-        # Check if group is full
-        if group.is_full:
-            return Response(
-                {'error': 'This group is full.'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
+            # Check if already a member
+            if group.my_membership_status == GroupMembership.STATUS_ACTIVE:
+                return Response(
+                    {'error': 'You are already a member of this group.'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
 
-        # Check privacy setting
-        if group.privacy == StudyGroup.PRIVACY_PUBLIC:
-            # Directly join
-            membership = GroupMembership.objects.create(
-                group=group,
-                user=request.user,
-                role=GroupMembership.ROLE_MEMBER,
-                status=GroupMembership.STATUS_ACTIVE
-            )
-            message = 'You have joined the group.'
-        elif group.privacy == StudyGroup.PRIVACY_PRIVATE:
-            # Create pending request
-            membership = GroupMembership.objects.create(
-                group=group,
-                user=request.user,
-                role=GroupMembership.ROLE_MEMBER,
-                status=GroupMembership.STATUS_PENDING
-            )
-            message = 'Your request to join has been sent to the group admins.'
-        elif group.privacy == StudyGroup.PRIVACY_INVITE_ONLY:
-            # Check if user has an invite
-            try:
-                membership = GroupMembership.objects.get(
-                    group=group,
-                    user=request.user,
-                    status=GroupMembership.STATUS_INVITED
+            # Check if a join request is already waiting for approval
+            if group.my_membership_status == GroupMembership.STATUS_PENDING:
+                return Response(
+                    {'error': 'You already have a pending request to join this group.'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            # Check if group is full
+            if group.is_full:
+                return Response(
+                    {'error': 'This group is full.'},
+                    status=status.HTTP_400_BAD_REQUEST
                 )
+
+            # Accept a pending invitation, otherwise follow the privacy setting
+            if group.my_membership_status == GroupMembership.STATUS_INVITED:
+                membership = GroupMembership.objects.select_related(
+                    'user', 'invited_by'
+                ).get(group=group, user=request.user)
                 membership.accept_invitation()
                 message = 'You have accepted the invitation and joined the group.'
-            except GroupMembership.DoesNotExist:
+            elif group.privacy == StudyGroup.PRIVACY_PUBLIC:
+                # Directly join
+                membership = GroupMembership.objects.create(
+                    group=group,
+                    user=request.user,
+                    role=GroupMembership.ROLE_MEMBER,
+                    status=GroupMembership.STATUS_ACTIVE
+                )
+                message = 'You have joined the group.'
+            elif group.privacy == StudyGroup.PRIVACY_PRIVATE:
+                # Create pending request
+                membership = GroupMembership.objects.create(
+                    group=group,
+                    user=request.user,
+                    role=GroupMembership.ROLE_MEMBER,
+                    status=GroupMembership.STATUS_PENDING
+                )
+                message = 'Your request to join has been sent to the group admins.'
+            elif group.privacy == StudyGroup.PRIVACY_INVITE_ONLY:
                 return Response(
                     {'error': 'This is an invite-only group. You must be invited to join.'},
                     status=status.HTTP_403_FORBIDDEN
                 )
-        else:
-            return Response(
-                {'error': 'Invalid privacy setting.'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
+            else:
+                return Response(
+                    {'error': 'Invalid privacy setting.'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
 
         response_serializer = GroupMembershipSerializer(
             membership,
@@ -268,29 +383,23 @@ class StudyGroupViewSet(viewsets.ModelViewSet):
             status=status.HTTP_200_OK
         )
 
-    @extend_schema(
-        responses={200: {'message': 'string'}},
-        description="Leave a study group"
-    )
+    @study_group_leave_schema
     @action(detail=True, methods=['post'])
     def leave(self, request, pk=None):
         """Leave a group."""
         group = self.get_object()
 
         try:
-            membership = group.memberships.get(
+            membership = group.memberships.annotate(
+                group_admin_count=GROUP_ADMIN_COUNT_SUBQUERY
+            ).get(
                 user=request.user,
                 status=GroupMembership.STATUS_ACTIVE
             )
 
             # Check if user is the last admin
             if membership.role == GroupMembership.ROLE_ADMIN:
-                admin_count = group.memberships.filter(
-                    role=GroupMembership.ROLE_ADMIN,
-                    status=GroupMembership.STATUS_ACTIVE
-                ).count()
-
-                if admin_count == 1:
+                if membership.group_admin_count == 1:
                     return Response(
                         {'error': 'You are the last admin. Please promote another member to admin before leaving.'},
                         status=status.HTTP_400_BAD_REQUEST
@@ -307,11 +416,7 @@ class StudyGroupViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-    @extend_schema(
-        request=InviteUserSerializer,
-        responses={200: GroupMembershipSerializer},
-        description="Invite a user to join the group (admin/moderator only)"
-    )
+    @study_group_invite_schema
     @action(detail=True, methods=['post'])
     def invite(self, request, pk=None):
         """Invite a user to the group."""
@@ -321,33 +426,34 @@ class StudyGroupViewSet(viewsets.ModelViewSet):
 
         user_to_invite = get_object_or_404(User, pk=serializer.validated_data['user_id'])
 
-        # Check if user is already a member
-        if group.is_member(user_to_invite):
-            return Response(
-                {'error': 'User is already a member of this group.'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        with transaction.atomic():
+            # Check if user is already a member
+            if group.is_member(user_to_invite):
+                return Response(
+                    {'error': 'User is already a member of this group.'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
 
-        # Check if invitation already exists
-        existing_invite = group.memberships.filter(
-            user=user_to_invite,
-            status__in=[GroupMembership.STATUS_INVITED, GroupMembership.STATUS_PENDING]
-        ).first()
+            # Check if invitation already exists
+            existing_invite = group.memberships.filter(
+                user=user_to_invite,
+                status__in=[GroupMembership.STATUS_INVITED, GroupMembership.STATUS_PENDING]
+            ).first()
 
-        if existing_invite:
-            return Response(
-                {'error': 'User already has a pending invitation or request.'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
+            if existing_invite:
+                return Response(
+                    {'error': 'User already has a pending invitation or request.'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
 
-        # Create invitation
-        membership = GroupMembership.objects.create(
-            group=group,
-            user=user_to_invite,
-            role=GroupMembership.ROLE_MEMBER,
-            status=GroupMembership.STATUS_INVITED,
-            invited_by=request.user
-        )
+            # Create invitation
+            membership = GroupMembership.objects.create(
+                group=group,
+                user=user_to_invite,
+                role=GroupMembership.ROLE_MEMBER,
+                status=GroupMembership.STATUS_INVITED,
+                invited_by=request.user
+            )
 
         response_serializer = GroupMembershipSerializer(
             membership,
@@ -355,27 +461,10 @@ class StudyGroupViewSet(viewsets.ModelViewSet):
         )
         return Response(response_serializer.data, status=status.HTTP_200_OK)
 
-    @extend_schema(
-        parameters=[
-            OpenApiParameter(
-                name='page',
-                type=OpenApiTypes.INT,
-                description='Page number for pagination (default: 1)'
-            ),
-            OpenApiParameter(
-                name='page_size',
-                type=OpenApiTypes.INT,
-                description='Number of results per page (default: 12, max: 100)'
-            ),
-        ],
-        responses={200: GroupMembershipSerializer(many=True)},
-        description="List all members of the group (paginated)"
-    )
+    @study_group_members_schema
     @action(detail=True, methods=['get'])
     def members(self, request, pk=None):
         """List group members with pagination."""
-        from rest_framework.pagination import PageNumberPagination
-        
         group = self.get_object()
 
         # Only show active members to non-members
@@ -385,116 +474,83 @@ class StudyGroupViewSet(viewsets.ModelViewSet):
             # Show all memberships to members (including pending)
             memberships = group.memberships.all()
 
-        memberships = memberships.select_related('user', 'invited_by').order_by('-role', 'joined_at')
+        memberships = memberships.select_related('user', 'invited_by').only(
+            *GROUP_MEMBERSHIP_FIELDS
+        ).order_by('-role', 'joined_at')
+
+        def build_data():
+            # Paginate at the database layer (COUNT + LIMIT/OFFSET)
+            paginator = PageNumberPagination()
+            paginator.page_size_query_param = 'page_size'
+            paginator.max_page_size = 100
+
+            page = paginator.paginate_queryset(memberships, request, view=self)
+            serializer = GroupMembershipSerializer(
+                page,
+                many=True,
+                context={'request': request}
+            )
+            return paginator.get_paginated_response(serializer.data).data
 
-        # Create paginator instance
-        paginator = PageNumberPagination()
-        
-        # Get page_size from query params, default to 12
-        try:
-            page_size = int(request.query_params.get('page_size', 12))
-            # Limit max page_size
-            if page_size > 100:
-                page_size = 100
-            paginator.page_size = page_size
-        except (ValueError, TypeError):
-            paginator.page_size = 12
-        
-        paginator.max_page_size = 100
-        
-        # Convert queryset to list to ensure pagination works
-        memberships_list = list(memberships)
-        total_count = len(memberships_list)
-        
-        # Get page number from query params (default: 1)
-        try:
-            page_number = int(request.query_params.get('page', 1))
-        except (ValueError, TypeError):
-            page_number = 1
-        
-        # Calculate pagination
-        start_index = (page_number - 1) * paginator.page_size
-        end_index = start_index + paginator.page_size
-        paginated_memberships = memberships_list[start_index:end_index]
-        
-        # Serialize the paginated results
-        serializer = GroupMembershipSerializer(
-            paginated_memberships,
-            many=True,
-            context={'request': request}
-        )
-        
-        # Create paginated response manually
-        response_data = {
-            'count': total_count,
-            'next': None,
-            'previous': None,
-            'results': serializer.data
-        }
-        
-        # Set next URL if there are more results
-        if end_index < total_count:
-            next_page = page_number + 1
-            from urllib.parse import urlencode, urlparse, urlunparse, parse_qs
-            parsed = urlparse(request.build_absolute_uri())
-            query_params = parse_qs(parsed.query)
-            query_params['page'] = [str(next_page)]
-            query_params['page_size'] = [str(paginator.page_size)]
-            new_query = urlencode(query_params, doseq=True)
-            response_data['next'] = urlunparse(parsed._replace(query=new_query))
-        
-        # Set previous URL if not on first page
-        if page_number > 1:
-            prev_page = page_number - 1
-            from urllib.parse import urlencode, urlparse, urlunparse, parse_qs
-            parsed = urlparse(request.build_absolute_uri())
-            query_params = parse_qs(parsed.query)
-            query_params['page'] = [str(prev_page)]
-            query_params['page_size'] = [str(paginator.page_size)]
-            new_query = urlencode(query_params, doseq=True)
-            response_data['previous'] = urlunparse(parsed._replace(query=new_query))
-        
-        return Response(response_data)
-
-    @extend_schema(
-        responses={200: StudyGroupListSerializer(many=True)},
-        description="List groups the current user is a member of"
-    )
+        return self._cached_json_response(f'members:{group.pk}', build_data)
+
+    @study_group_my_groups_schema
     @action(detail=False, methods=['get'])
     def my_groups(self, request):
         """List user's groups."""
         user = request.user
 
+        # Plain value rows: the caller is an active member of every group here,
+        # so their role comes from the same query instead of per-row lookups
         queryset = StudyGroup.objects.filter(
-            memberships__user=user,
-            memberships__status=GroupMembership.STATUS_ACTIVE
-        ).select_related('created_by', 'school').prefetch_related(
-            'subjects', 'memberships__user'
-        ).order_by('-created_at')
-
-        serializer = StudyGroupListSerializer(
-            queryset,
-            many=True,
-            context={'request': request}
+            models.Exists(
+                GroupMembership.objects.filter(
+                    group=models.OuterRef('pk'),
+                    user=user,
+                    status=GroupMembership.STATUS_ACTIVE
+                )
+            )
+        ).annotate(
+            active_member_count=ACTIVE_MEMBER_COUNT_SUBQUERY,
+            user_role=models.Subquery(
+                GroupMembership.objects.filter(
+                    group=models.OuterRef('pk'),
+                    user=user,
+                    status=GroupMembership.STATUS_ACTIVE
+                ).values('role')[:1]
+            )
+        ).order_by('-created_at').values(
+            *StudyGroupRowSerializer.ROW_FIELDS, 'active_member_count', 'user_role'
         )
-        return Response(serializer.data)
 
-    @extend_schema(
-        parameters=[
-            OpenApiParameter(
-                name='radius_km',
-                type=OpenApiTypes.FLOAT,
-                description='Search radius in kilometers (default: 10km)'
-            ),
-            OpenApiParameter(
-                name='subject',
-                type=OpenApiTypes.INT,
-                description='Filter by subject ID'
-            ),
-        ],
-        responses={200: StudyGroupListSerializer(many=True)},
-        description="Find nearby study groups"
-    )
+        def build_data():
+            rows = self.paginate_queryset(queryset)
+
+            # Attach subjects for the whole page in one query
+            subjects_by_group = {row['id']: [] for row in rows}
+            subject_links = StudyGroup.subjects.through.objects.filter(
+                studygroup_id__in=subjects_by_group
+            ).order_by('-subject__created_at').values(
+                'studygroup_id', 'subject__id', 'subject__code', 'subject__name_en',
+                'subject__name_vi', 'subject__level'
+            )
+            for link in subject_links:
+                subjects_by_group[link['studygroup_id']].append({
+                    'id': link['subject__id'],
+                    'code': link['subject__code'],
+                    'name_en': link['subject__name_en'],
+                    'name_vi': link['subject__name_vi'],
+                    'level': link['subject__level'],
+                })
+            for row in rows:
+                row['subjects'] = subjects_by_group[row['id']]
+
+            serializer = StudyGroupRowSerializer(rows, many=True)
+            return self.get_paginated_response(serializer.data).data
+
+        return self._cached_json_response('my_groups', build_data)
+
+    @study_group_nearby_schema
     @action(detail=False, methods=['get'])
     def nearby(self, request):
         """Find nearby study groups."""
@@ -515,19 +571,28 @@ class StudyGroupViewSet(viewsets.ModelViewSet):
             status=StudyGroup.STATUS_ACTIVE
         ).exclude(
             privacy=StudyGroup.PRIVACY_INVITE_ONLY
-        ).filter(
-            geom_point__dwithin=(user.geom_last_point, D(km=radius_km))
-        ).annotate(
-            distance_km=Distance('geom_point', user.geom_last_point)
-        ).select_related('created_by', 'school').prefetch_related(
-            'subjects'
-        ).order_by('distance_km')
+        )
 
-        # Apply subject filter if provided
+        # Apply subject filter before the spatial part of the query
         subject_id = request.query_params.get('subject')
         if subject_id:
             queryset = queryset.filter(subjects__id=subject_id)
 
+        # Order with the PostGIS KNN operator so the GiST index drives the scan
+        knn_distance = RawSQL(
+            f'"{StudyGroup._meta.db_table}"."geom_point" <-> %s::geography',
+            (user.geom_last_point.ewkt,)
+        )
+        queryset = queryset.filter(
+            geom_point__dwithin=(user.geom_last_point, D(km=radius_km))
+        ).annotate(
+            active_member_count=ACTIVE_MEMBER_COUNT_SUBQUERY
+        ).select_related('created_by', 'school').only(
+            *STUDY_GROUP_LIST_FIELDS
+        ).prefetch_related(
+            'subjects'
+        ).order_by(knn_distance)[:NEARBY_MAX_RESULTS]
+
         serializer = StudyGroupListSerializer(
             queryset,
             many=True,
@@ -555,26 +620,29 @@ class GroupMembershipViewSet(viewsets.GenericViewSet):
     def get_queryset(self):
         """Filter to memberships the user can see."""
         user = self.request.user
-        return GroupMembership.objects.filter(
-            models.Q(group__memberships__user=user, group__memberships__status=GroupMembership.STATUS_ACTIVE) |
-            models.Q(user=user)
-        ).select_related('group', 'user', 'invited_by').distinct()
-
-    @extend_schema(
-        responses={200: GroupMembershipSerializer},
-        description="Get membership details"
-    )
+        # Uncorrelated semi-join on the (user, status) index
+        user_group_ids = GroupMembership.objects.filter(
+            user=user,
+            status=GroupMembership.STATUS_ACTIVE
+        ).values('group_id')
+        queryset = GroupMembership.objects.filter(
+            models.Q(group_id__in=models.Subquery(user_group_ids)) | models.Q(user=user)
+        ).select_related('group', 'user', 'invited_by')
+
+        # Load the group's admin count with the membership for the last-admin guard
+        if self.action in ['role', 'remove']:
+            queryset = queryset.annotate(group_admin_count=GROUP_ADMIN_COUNT_SUBQUERY)
+
+        return queryset
+
+    @membership_retrieve_schema
     def retrieve(self, request, pk=None):
         """Get membership details."""
         membership = self.get_object()
         serializer = self.get_serializer(membership)
         return Response(serializer.data)
 
-    @extend_schema(
-        request=UpdateMemberRoleSerializer,
-        responses={200: GroupMembershipSerializer},
-        description="Update a member's role (admin only)"
-    )
+    @membership_role_schema
     @action(detail=True, methods=['patch'], permission_classes=[IsAuthenticated, IsGroupAdmin])
     def role(self, request, pk=None):
         """Update member role (admin only)."""
@@ -587,19 +655,21 @@ class GroupMembershipViewSet(viewsets.GenericViewSet):
 
         # Check if trying to demote the last admin
         if membership.role == GroupMembership.ROLE_ADMIN and new_role != GroupMembership.ROLE_ADMIN:
-            admin_count = membership.group.memberships.filter(
-                role=GroupMembership.ROLE_ADMIN,
-                status=GroupMembership.STATUS_ACTIVE
-            ).count()
-
-            if admin_count == 1:
+            if membership.group_admin_count == 1:
                 return Response(
                     {'error': 'Cannot demote the last admin. Promote another member first.'},
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
+        # Single UPDATE; update() skips post_save, so invalidate caches explicitly
+        updated_at = timezone.now()
+        GroupMembership.objects.filter(pk=membership.pk).update(
+            role=new_role,
+            updated_at=updated_at
+        )
+        GroupMembershipCacheService.invalidate_on_commit(membership.group_id, membership.user_id)
         membership.role = new_role
-        membership.save(update_fields=['role', 'updated_at'])
+        membership.updated_at = updated_at
 
         response_serializer = GroupMembershipSerializer(
             membership,
@@ -607,10 +677,7 @@ class GroupMembershipViewSet(viewsets.GenericViewSet):
         )
         return Response(response_serializer.data)
 
-    @extend_schema(
-        responses={200: GroupMembershipSerializer},
-        description="Accept a join request (admin only)"
-    )
+    @membership_accept_schema
     @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated, IsGroupAdmin])
     def accept(self, request, pk=None):
         """Accept a join request."""
@@ -630,10 +697,7 @@ class GroupMembershipViewSet(viewsets.GenericViewSet):
         )
         return Response(response_serializer.data)
 
-    @extend_schema(
-        responses={200: {'message': 'string'}},
-        description="Reject a join request (admin only)"
-    )
+    @membership_reject_schema
     @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated, IsGroupAdmin])
     def reject(self, request, pk=None):
         """Reject a join request."""
@@ -648,10 +712,7 @@ class GroupMembershipViewSet(viewsets.GenericViewSet):
         membership.delete()
         return Response({'message': 'Join request rejected.'})
 
-    @extend_schema(
-        responses={200: {'message': 'string'}},
-        description="Remove a member from the group (admin only)"
-    )
+    @membership_remove_schema
     @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated, IsGroupAdmin])
     def remove(self, request, pk=None):
         """Remove a member from the group."""
@@ -659,12 +720,7 @@ class GroupMembershipViewSet(viewsets.GenericViewSet):
 
         # Check if trying to remove the last admin
         if membership.role == GroupMembership.ROLE_ADMIN:
-            admin_count = membership.group.memberships.filter(
-                role=GroupMembership.ROLE_ADMIN,
-                status=GroupMembership.STATUS_ACTIVE
-            ).count()
-
-            if admin_count == 1:
+            if membership.group_admin_count == 1:
                 return Response(
                     {'error': 'Cannot remove the last admin.'},
                     status=status.HTTP_400_BAD_REQUEST
@@ -686,16 +742,32 @@ class GroupMessageViewSet(viewsets.GenericViewSet):
 
     permission_classes = [IsAuthenticated, IsGroupMember]
     serializer_class = GroupMessageSerializer
-    pagination_class = None  # We'll use custom pagination
+    pagination_class = GroupMessagePagination
+    filter_backends = []  # Cursor pagination owns the ordering
+
+    @cached_property
+    def group(self):
+        """The group from the URL, with its conversation (fetched once per request)."""
+        return get_object_or_404(
+            StudyGroup.objects.select_related('conversation'),
+            pk=self.kwargs.get('group_id')
+        )
 
-    def get_group(self):
-        """Get the group from the URL."""
-        group_id = self.kwargs.get('group_id')
-        return get_object_or_404(StudyGroup, pk=group_id)
+    def get_conversation(self):
+        """
+        Get the group's conversation, loaded together with the group.
+        Groups get a conversation on creation; older groups without one get it lazily here.
+        """
+        group = self.group
+        try:
+            return group.conversation
+        except GroupConversation.DoesNotExist:
+            conversation, created = GroupConversation.objects.get_or_create(group=group)
+            return conversation
 
     def get_queryset(self):
         """Get messages for the group."""
-        group = self.get_group()
+        group = self.group
 
         # Ensure user is a member
         if not group.is_member(self.request.user):
@@ -707,53 +779,27 @@ class GroupMessageViewSet(viewsets.GenericViewSet):
             # Frontend will reverse to show oldest first
             return GroupMessage.objects.filter(
                 conversation=conversation
-            ).select_related('sender').order_by('-created_at')
+            ).select_related('sender').order_by('-created_at', '-id')
         except GroupConversation.DoesNotExist:
             return GroupMessage.objects.none()
 
-    @extend_schema(
-        parameters=[
-            OpenApiParameter(
-                name='page',
-                type=OpenApiTypes.INT,
-                description='Page number'
-            ),
-            OpenApiParameter(
-                name='page_size',
-                type=OpenApiTypes.INT,
-                description='Number of messages per page (default: 50)'
-            ),
-        ],
-        responses={200: GroupMessageSerializer(many=True)},
-        description="List group messages with pagination"
-    )
+    @group_message_list_schema
     def list(self, request, group_id=None):
-        """List group messages with pagination."""
-        from rest_framework.pagination import PageNumberPagination
-        
+        """List group messages with cursor pagination."""
         queryset = self.get_queryset()
-        
-        # Custom paginator
-        paginator = PageNumberPagination()
-        paginator.page_size = int(request.query_params.get('page_size', 50))
-        paginator.max_page_size = 100
-        
-        page = paginator.paginate_queryset(queryset, request)
+
+        page = self.paginate_queryset(queryset)
         if page is not None:
             serializer = self.get_serializer(page, many=True)
-            return paginator.get_paginated_response(serializer.data)
-        
+            return self.get_paginated_response(serializer.data)
+
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
 
-    @extend_schema(
-        request=CreateGroupMessageSerializer,
-        responses={201: GroupMessageSerializer},
-        description="Send a message to the group"
-    )
+    @group_message_create_schema
     def create(self, request, group_id=None):
         """Send a message to the group."""
-        group = self.get_group()
+        group = self.group
 
         # Ensure user is a member
         if not group.is_member(request.user):
@@ -762,15 +808,16 @@ class GroupMessageViewSet(viewsets.GenericViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        # Get or create conversation
-        conversation, created = GroupConversation.objects.get_or_create(group=group)
+        # Message insert and conversation last_message_at update commit together
+        with transaction.atomic():
+            conversation = self.get_conversation()
 
-        serializer = CreateGroupMessageSerializer(
-            data=request.data,
-            context={'request': request, 'conversation': conversation}
-        )
-        serializer.is_valid(raise_exception=True)
-        message = serializer.save()
+            serializer = CreateGroupMessageSerializer(
+                data=request.data,
+                context={'request': request, 'conversation': conversation}
+            )
+            serializer.is_valid(raise_exception=True)
+            message = serializer.save()
 
         response_serializer = GroupMessageSerializer(
             message,
@@ -778,15 +825,11 @@ class GroupMessageViewSet(viewsets.GenericViewSet):
         )
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
 
-    @extend_schema(
-        request=MarkMessagesReadSerializer,
-        responses={200: {'message': 'string'}},
-        description="Mark messages as read"
-    )
+    @group_message_mark_read_schema
     @action(detail=False, methods=['post'])
     def mark_read(self, request, group_id=None):
         """Mark messages as read."""
-        group = self.get_group()
+        group = self.group
 
         if not group.is_member(request.user):
             return Response(
@@ -799,14 +842,19 @@ class GroupMessageViewSet(viewsets.GenericViewSet):
 
         message_ids = serializer.validated_data['message_ids']
 
-        # Bulk create read records
-        read_records = []
-        for message_id in message_ids:
-            if not GroupMessageRead.objects.filter(message_id=message_id, user=request.user).exists():
-                read_records.append(
-                    GroupMessageRead(message_id=message_id, user=request.user)
-                )
+        # Fetch already-read ids once so the reported count stays accurate
+        already_read = set(
+            GroupMessageRead.objects.filter(
+                message_id__in=message_ids,
+                user=request.user
+            ).values_list('message_id', flat=True)
+        )
 
-        GroupMessageRead.objects.bulk_create(read_records, ignore_conflicts=True)
+        # Bulk create read records (ON CONFLICT DO NOTHING handles races)
+        read_records = [
+            GroupMessageRead(message_id=message_id, user=request.user)
+            for message_id in set(message_ids) - already_read
+        ]
+        GroupMessageRead.objects.bulk_create(read_records, ignore_conflicts=True, batch_size=500)
 
         return Response({'message': f'{len(read_records)} messages marked as read.'})
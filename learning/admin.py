@@ -1,7 +1,35 @@
 from django.contrib import admin
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
 from learning.models import Subject, UserSubject, Goal, UserGoal
 
 
+class FasterAdminPaginator(Paginator):
+    """
+    Paginator that uses the planner's row estimate for unfiltered changelists
+    instead of running SELECT count(*) over the whole table.
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if queryset.query.where:
+            return super().count
+
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                [queryset.model._meta.db_table]
+            )
+            row = cursor.fetchone()
+
+        # reltuples is -1 (or 0) until the table has been analyzed
+        if not row or row[0] <= 0:
+            return super().count
+        return row[0]
+
+
 @admin.register(Subject)
 class SubjectAdmin(admin.ModelAdmin):
     """Admin configuration for Subject model."""
@@ -10,17 +38,24 @@ class SubjectAdmin(admin.ModelAdmin):
     search_fields = ["code", "name_en", "name_vi"]
     ordering = ["-created_at"]
     readonly_fields = ["created_at", "updated_at"]
+    list_per_page = 25
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
 
 
 @admin.register(UserSubject)
 class UserSubjectAdmin(admin.ModelAdmin):
     """Admin configuration for UserSubject model."""
     list_display = ["id", "user", "subject", "level", "intent", "created_at"]
-    list_filter = ["level", "intent", "created_at"]
+    list_filter = ["level", "intent"]
     search_fields = ["user__email", "user__full_name", "subject__code", "subject__name_en"]
     ordering = ["-created_at"]
     readonly_fields = ["created_at", "updated_at"]
-    raw_id_fields = ["user", "subject"]
+    list_per_page = 25
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
+    autocomplete_fields = ["user", "subject"]
+    list_select_related = ["user", "subject"]
 
 
 @admin.register(Goal)
@@ -31,15 +66,22 @@ class GoalAdmin(admin.ModelAdmin):
     search_fields = ["code", "name"]
     ordering = ["-created_at"]
     readonly_fields = ["created_at", "updated_at"]
+    list_per_page = 25
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
 
 
 @admin.register(UserGoal)
 class UserGoalAdmin(admin.ModelAdmin):
     """Admin configuration for UserGoal model."""
     list_display = ["id", "user", "goal", "target_value", "target_date", "created_at"]
-    list_filter = ["target_date", "created_at"]
+    list_filter = ["target_date"]
     search_fields = ["user__email", "user__full_name", "goal__code", "goal__name"]
     ordering = ["-created_at"]
     readonly_fields = ["created_at", "updated_at"]
-    raw_id_fields = ["user", "goal"]
+    list_per_page = 25
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
+    autocomplete_fields = ["user", "goal"]
+    list_select_related = ["user", "goal"]
 
@@ -0,0 +1,55 @@
+"""
+Custom model fields for learning app.
+"""
+from django.core import exceptions
+from django.db import models
+from django.utils.functional import cached_property
+
+
+class ChoiceCodeField(models.PositiveSmallIntegerField):
+    """
+    Stores one of a fixed set of string codes as a small integer.
+
+    The column holds the 1-based position of the code in `choices`, while
+    model instances, query lookups and API payloads keep using the string
+    codes. New choices must therefore only ever be appended.
+    """
+
+    @cached_property
+    def _code_to_int(self):
+        return {code: index for index, (code, _) in enumerate(self.flatchoices, start=1)}
+
+    @cached_property
+    def _int_to_code(self):
+        return {index: code for code, index in self._code_to_int.items()}
+
+    @cached_property
+    def validators(self):
+        # The integer range validators don't apply to the string codes,
+        # and the choices check already bounds the stored value.
+        return list(self._validators)
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return self._int_to_code[value]
+
+    def to_python(self, value):
+        if value is None or isinstance(value, str):
+            return value
+        try:
+            return self._int_to_code[value]
+        except (KeyError, TypeError):
+            raise exceptions.ValidationError(
+                self.error_messages["invalid_choice"],
+                code="invalid_choice",
+                params={"value": value},
+            )
+
+    def get_prep_value(self, value):
+        if isinstance(value, str):
+            try:
+                return self._code_to_int[value]
+            except KeyError:
+                raise ValueError(f"Field '{self.name}' expected one of {list(self._code_to_int)} but got {value!r}.")
+        return super().get_prep_value(value)
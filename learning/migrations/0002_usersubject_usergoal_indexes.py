@@ -0,0 +1,25 @@
+# Generated by Django 5.2.7 on 2026-10-15 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('learning', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='usersubject',
+            index=models.Index(fields=['user', '-created_at'], name='user_subjec_user_id_d61572_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='usergoal',
+            index=models.Index(fields=['user', '-created_at'], name='user_goals_user_id_f662c4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='usergoal',
+            index=models.Index(fields=['goal', 'target_date'], name='user_goals_goal_id_941a3d_idx'),
+        ),
+    ]
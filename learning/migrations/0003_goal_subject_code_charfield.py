@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-15 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('learning', '0002_usersubject_usergoal_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='goal',
+            name='code',
+            field=models.CharField(help_text='Unique goal code', max_length=64, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='subject',
+            name='code',
+            field=models.CharField(help_text='Unique subject code', max_length=64, unique=True),
+        ),
+    ]
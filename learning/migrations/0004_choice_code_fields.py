@@ -0,0 +1,56 @@
+# Generated by Django 5.2.7 on 2026-10-15 09:00
+
+import learning.fields
+from django.db import migrations
+
+LEVEL_CODES = ['beginner', 'intermediate', 'advanced', 'expert']
+INTENT_CODES = ['learn', 'teach', 'both']
+TYPE_CODES = ['daily', 'weekly', 'monthly', 'yearly', 'milestone']
+
+
+def codes_to_smallint(table, column, codes):
+    """
+    Convert a varchar code column to smallint positions in place.
+    The reverse runs after AlterField has cast the column back to varchar,
+    so it maps the positions' text form back to the codes.
+    """
+    to_int = ' '.join(f"WHEN '{code}' THEN {index}" for index, code in enumerate(codes, start=1))
+    to_code = ' '.join(f"WHEN '{index}' THEN '{code}'" for index, code in enumerate(codes, start=1))
+    return migrations.RunSQL(
+        sql=f'ALTER TABLE "{table}" ALTER COLUMN "{column}" TYPE smallint USING CASE "{column}" {to_int} END',
+        reverse_sql=f'ALTER TABLE "{table}" ALTER COLUMN "{column}" TYPE varchar(50) USING CASE "{column}" {to_code} END',
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('learning', '0003_goal_subject_code_charfield'),
+    ]
+
+    operations = [
+        codes_to_smallint('goals', 'type', TYPE_CODES),
+        migrations.AlterField(
+            model_name='goal',
+            name='type',
+            field=learning.fields.ChoiceCodeField(choices=[('daily', 'Daily'), ('weekly', 'Weekly'), ('monthly', 'Monthly'), ('yearly', 'Yearly'), ('milestone', 'Milestone')], help_text='Goal type (daily/weekly/monthly/etc.)'),
+        ),
+        codes_to_smallint('subjects', 'level', LEVEL_CODES),
+        migrations.AlterField(
+            model_name='subject',
+            name='level',
+            field=learning.fields.ChoiceCodeField(blank=True, choices=[('beginner', 'Beginner'), ('intermediate', 'Intermediate'), ('advanced', 'Advanced'), ('expert', 'Expert')], help_text='Subject difficulty level', null=True),
+        ),
+        codes_to_smallint('user_subjects', 'level', LEVEL_CODES),
+        migrations.AlterField(
+            model_name='usersubject',
+            name='level',
+            field=learning.fields.ChoiceCodeField(choices=[('beginner', 'Beginner'), ('intermediate', 'Intermediate'), ('advanced', 'Advanced'), ('expert', 'Expert')], help_text="User's level in this subject"),
+        ),
+        codes_to_smallint('user_subjects', 'intent', INTENT_CODES),
+        migrations.AlterField(
+            model_name='usersubject',
+            name='intent',
+            field=learning.fields.ChoiceCodeField(choices=[('learn', 'Learn'), ('teach', 'Teach'), ('both', 'Both')], help_text="User's intent (learn/teach/both)"),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.7 on 2026-10-15 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('learning', '0004_choice_code_fields'),
+    ]
+
+    operations = [
+        # Reuse the existing unique_together index instead of rebuilding it
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    sql='ALTER TABLE "user_subjects" RENAME CONSTRAINT "user_subjects_user_id_subject_id_25ca279e_uniq" TO "uniq_usersubject_user_subject"',
+                    reverse_sql='ALTER TABLE "user_subjects" RENAME CONSTRAINT "uniq_usersubject_user_subject" TO "user_subjects_user_id_subject_id_25ca279e_uniq"',
+                ),
+            ],
+            state_operations=[
+                migrations.AlterUniqueTogether(
+                    name='usersubject',
+                    unique_together=set(),
+                ),
+                migrations.AddConstraint(
+                    model_name='usersubject',
+                    constraint=models.UniqueConstraint(fields=('user', 'subject'), name='uniq_usersubject_user_subject'),
+                ),
+            ],
+        ),
+    ]
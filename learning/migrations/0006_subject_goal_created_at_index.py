@@ -0,0 +1,21 @@
+# Generated by Django 5.2.7 on 2026-10-15 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('learning', '0005_usersubject_unique_constraint'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='goal',
+            index=models.Index(fields=['-created_at', '-id'], name='goals_created_5ffa5d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='subject',
+            index=models.Index(fields=['-created_at', '-id'], name='subjects_created_d0c196_idx'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.7 on 2026-10-15 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('learning', '0007_subject_trigram_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='subject',
+            name='user_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of users with this subject, maintained by a trigger on user_subjects'),
+        ),
+        migrations.RunSQL(
+            sql="""
+                CREATE OR REPLACE FUNCTION subjects_sync_user_count() RETURNS trigger AS $$
+                BEGIN
+                    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                        UPDATE subjects SET user_count = user_count + 1 WHERE id = NEW.subject_id;
+                    END IF;
+                    IF TG_OP IN ('DELETE', 'UPDATE') THEN
+                        UPDATE subjects SET user_count = user_count - 1 WHERE id = OLD.subject_id;
+                    END IF;
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+
+                CREATE TRIGGER trg_user_subjects_user_count
+                AFTER INSERT OR DELETE ON user_subjects
+                FOR EACH ROW EXECUTE FUNCTION subjects_sync_user_count();
+
+                CREATE TRIGGER trg_user_subjects_user_count_move
+                AFTER UPDATE OF subject_id ON user_subjects
+                FOR EACH ROW WHEN (OLD.subject_id IS DISTINCT FROM NEW.subject_id)
+                EXECUTE FUNCTION subjects_sync_user_count();
+
+                UPDATE subjects SET user_count = (
+                    SELECT COUNT(*) FROM user_subjects WHERE user_subjects.subject_id = subjects.id
+                );
+            """,
+            reverse_sql="""
+                DROP TRIGGER IF EXISTS trg_user_subjects_user_count_move ON user_subjects;
+                DROP TRIGGER IF EXISTS trg_user_subjects_user_count ON user_subjects;
+                DROP FUNCTION IF EXISTS subjects_sync_user_count();
+            """,
+        ),
+    ]
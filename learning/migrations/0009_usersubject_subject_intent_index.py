@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-15 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('learning', '0008_subject_user_count'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='usersubject',
+            index=models.Index(fields=['subject', 'intent'], name='user_subjec_subject_1843f8_idx'),
+        ),
+    ]
@@ -1,6 +1,10 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.conf import settings
 
+from learning.fields import ChoiceCodeField
+
 
 class Subject(models.Model):
     """
@@ -18,10 +22,15 @@ class Subject(models.Model):
         (LEVEL_EXPERT, "Expert"),
     ]
     
-    code = models.TextField(unique=True, db_index=True, help_text="Unique subject code")
+    code = models.CharField(max_length=64, unique=True, help_text="Unique subject code")
     name_vi = models.TextField(help_text="Subject name in Vietnamese")
     name_en = models.TextField(help_text="Subject name in English")
-    level = models.CharField(max_length=50, choices=LEVEL_CHOICES, null=True, blank=True, help_text="Subject difficulty level")
+    level = ChoiceCodeField(choices=LEVEL_CHOICES, null=True, blank=True, help_text="Subject difficulty level")
+    user_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of users with this subject, maintained by a trigger on user_subjects"
+    )
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -29,11 +38,29 @@ class Subject(models.Model):
     class Meta:
         db_table = "subjects"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at", "-id"]),
+            # Trigram indexes on UPPER(column) match the SQL Django emits for
+            # icontains, so ?search= can use them instead of a seq scan
+            GinIndex(OpClass(Upper("code"), name="gin_trgm_ops"), name="subjects_code_trgm"),
+            GinIndex(OpClass(Upper("name_vi"), name="gin_trgm_ops"), name="subjects_name_vi_trgm"),
+            GinIndex(OpClass(Upper("name_en"), name="gin_trgm_ops"), name="subjects_name_en_trgm"),
+        ]
         verbose_name = "Subject"
         verbose_name_plural = "Subjects"
     
     def __str__(self):
         return f"{self.code} - {self.name_en}"
+    
+    def save(self, *args, **kwargs):
+        # user_count belongs to the user_subjects trigger, so updates never
+        # write back the possibly stale copy loaded with this instance
+        if not self._state.adding and kwargs.get("update_fields") is None and not kwargs.get("force_insert"):
+            kwargs["update_fields"] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != "user_count"
+            ]
+        super().save(*args, **kwargs)
 
 
 class UserSubject(models.Model):
@@ -74,8 +101,8 @@ class UserSubject(models.Model):
         related_name="user_subjects",
         db_column="subject_id"
     )
-    level = models.CharField(max_length=50, choices=LEVEL_CHOICES, help_text="User's level in this subject")
-    intent = models.CharField(max_length=50, choices=INTENT_CHOICES, help_text="User's intent (learn/teach/both)")
+    level = ChoiceCodeField(choices=LEVEL_CHOICES, help_text="User's level in this subject")
+    intent = ChoiceCodeField(choices=INTENT_CHOICES, help_text="User's intent (learn/teach/both)")
     note = models.TextField(blank=True, default="", help_text="Additional notes")
     
     created_at = models.DateTimeField(auto_now_add=True)
@@ -84,12 +111,27 @@ class UserSubject(models.Model):
     class Meta:
         db_table = "user_subjects"
         ordering = ["-created_at"]
-        unique_together = [["user", "subject"]]
+        constraints = [
+            models.UniqueConstraint(fields=["user", "subject"], name="uniq_usersubject_user_subject"),
+        ]
+        indexes = [
+            models.Index(fields=["user", "-created_at"]),
+            # Covers the per-subject learner/teacher counts with an index-only scan
+            models.Index(fields=["subject", "intent"]),
+        ]
         verbose_name = "User Subject"
         verbose_name_plural = "User Subjects"
     
     def __str__(self):
         return f"{self.user.email} - {self.subject.code} ({self.intent})"
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Subject the row was loaded with, so moving it to another subject can
+        # invalidate both subjects' cached counts (see learning.signals)
+        instance._loaded_subject_id = instance.__dict__.get("subject_id")
+        return instance
 
 
 class Goal(models.Model):
@@ -110,9 +152,9 @@ class Goal(models.Model):
         (TYPE_MILESTONE, "Milestone"),
     ]
     
-    code = models.TextField(unique=True, db_index=True, help_text="Unique goal code")
+    code = models.CharField(max_length=64, unique=True, help_text="Unique goal code")
     name = models.TextField(help_text="Goal name/description")
-    type = models.CharField(max_length=50, choices=TYPE_CHOICES, help_text="Goal type (daily/weekly/monthly/etc.)")
+    type = ChoiceCodeField(choices=TYPE_CHOICES, help_text="Goal type (daily/weekly/monthly/etc.)")
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -120,6 +162,9 @@ class Goal(models.Model):
     class Meta:
         db_table = "goals"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at", "-id"]),
+        ]
         verbose_name = "Goal"
         verbose_name_plural = "Goals"
     
@@ -153,6 +198,10 @@ class UserGoal(models.Model):
         db_table = "user_goals"
         ordering = ["-created_at"]
         unique_together = [["user", "goal"]]
+        indexes = [
+            models.Index(fields=["user", "-created_at"]),
+            models.Index(fields=["goal", "target_date"]),
+        ]
         verbose_name = "User Goal"
         verbose_name_plural = "User Goals"
     
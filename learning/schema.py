@@ -29,29 +29,52 @@ ErrorResponseSerializer = inline_serializer(
 )
 
 
+def _ordering_parameter(*fields):
+    """Build the `ordering` query parameter for the given orderable fields."""
+    return OpenApiParameter(
+        name="ordering",
+        type=OpenApiTypes.STR,
+        location=OpenApiParameter.QUERY,
+        description=f"Order results by: {', '.join(fields)} (prefix with - for descending)"
+    )
+
+
+# Shared query parameters
+SUBJECT_SEARCH_PARAMETER = OpenApiParameter(
+    name="search",
+    type=OpenApiTypes.STR,
+    location=OpenApiParameter.QUERY,
+    description="Search by subject code, name_vi, or name_en"
+)
+
+GOAL_SEARCH_PARAMETER = OpenApiParameter(
+    name="search",
+    type=OpenApiTypes.STR,
+    location=OpenApiParameter.QUERY,
+    description="Search by goal code or name"
+)
+
+GOAL_TYPE_PARAMETER = OpenApiParameter(
+    name="type",
+    type=OpenApiTypes.STR,
+    location=OpenApiParameter.QUERY,
+    description="Filter by goal type (daily, weekly, monthly, yearly, milestone)"
+)
+
+
 # Subject List/Create schemas
 subject_list_schema = extend_schema(
     summary="List subjects",
     description="Get a paginated list of subjects. Supports search and filtering.",
     parameters=[
-        OpenApiParameter(
-            name="search",
-            type=OpenApiTypes.STR,
-            location=OpenApiParameter.QUERY,
-            description="Search subjects by code, name_vi, or name_en"
-        ),
+        SUBJECT_SEARCH_PARAMETER,
         OpenApiParameter(
             name="level",
             type=OpenApiTypes.STR,
             location=OpenApiParameter.QUERY,
             description="Filter subjects by level (beginner, intermediate, advanced, expert)"
         ),
-        OpenApiParameter(
-            name="ordering",
-            type=OpenApiTypes.STR,
-            location=OpenApiParameter.QUERY,
-            description="Order results by: code, name_en, created_at (prefix with - for descending)"
-        ),
+        _ordering_parameter("code", "created_at"),
     ],
     responses={200: SubjectListSerializer(many=True)},
     tags=["Subjects"]
@@ -103,12 +126,7 @@ user_subject_list_schema = extend_schema(
     summary="List user subjects",
     description="Get a paginated list of subjects for the authenticated user. Supports search and filtering.",
     parameters=[
-        OpenApiParameter(
-            name="search",
-            type=OpenApiTypes.STR,
-            location=OpenApiParameter.QUERY,
-            description="Search by subject code, name_vi, or name_en"
-        ),
+        SUBJECT_SEARCH_PARAMETER,
         OpenApiParameter(
             name="level",
             type=OpenApiTypes.STR,
@@ -121,12 +139,7 @@ user_subject_list_schema = extend_schema(
             location=OpenApiParameter.QUERY,
             description="Filter by intent (learn, teach, both)"
         ),
-        OpenApiParameter(
-            name="ordering",
-            type=OpenApiTypes.STR,
-            location=OpenApiParameter.QUERY,
-            description="Order results by: level, intent, created_at (prefix with - for descending)"
-        ),
+        _ordering_parameter("created_at"),
     ],
     responses={200: UserSubjectListSerializer(many=True)},
     tags=["User Subjects"]
@@ -178,24 +191,9 @@ goal_list_schema = extend_schema(
     summary="List goals",
     description="Get a paginated list of goals. Supports search and filtering.",
     parameters=[
-        OpenApiParameter(
-            name="search",
-            type=OpenApiTypes.STR,
-            location=OpenApiParameter.QUERY,
-            description="Search goals by code or name"
-        ),
-        OpenApiParameter(
-            name="type",
-            type=OpenApiTypes.STR,
-            location=OpenApiParameter.QUERY,
-            description="Filter goals by type (daily, weekly, monthly, yearly, milestone)"
-        ),
-        OpenApiParameter(
-            name="ordering",
-            type=OpenApiTypes.STR,
-            location=OpenApiParameter.QUERY,
-            description="Order results by: code, name, type, created_at (prefix with - for descending)"
-        ),
+        GOAL_SEARCH_PARAMETER,
+        GOAL_TYPE_PARAMETER,
+        _ordering_parameter("code", "created_at"),
     ],
     responses={200: GoalListSerializer(many=True)},
     tags=["Goals"]
@@ -247,24 +245,9 @@ user_goal_list_schema = extend_schema(
     summary="List user goals",
     description="Get a paginated list of goals for the authenticated user. Supports search and filtering.",
     parameters=[
-        OpenApiParameter(
-            name="search",
-            type=OpenApiTypes.STR,
-            location=OpenApiParameter.QUERY,
-            description="Search by goal code or name"
-        ),
-        OpenApiParameter(
-            name="type",
-            type=OpenApiTypes.STR,
-            location=OpenApiParameter.QUERY,
-            description="Filter by goal type (daily, weekly, monthly, yearly, milestone)"
-        ),
-        OpenApiParameter(
-            name="ordering",
-            type=OpenApiTypes.STR,
-            location=OpenApiParameter.QUERY,
-            description="Order results by: target_value, target_date, created_at (prefix with - for descending)"
-        ),
+        GOAL_SEARCH_PARAMETER,
+        GOAL_TYPE_PARAMETER,
+        _ordering_parameter("created_at"),
     ],
     responses={200: UserGoalListSerializer(many=True)},
     tags=["User Goals"]
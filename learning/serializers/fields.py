@@ -0,0 +1,54 @@
+"""
+Custom serializer fields for learning app.
+"""
+from collections.abc import Mapping
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from rest_framework import serializers
+
+
+class BatchPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    PrimaryKeyRelatedField that resolves every pk sent for this field in the
+    request payload with a single in_bulk() query.
+
+    Resolved objects are kept in the serializer context, so each item of a
+    many=True payload reuses them instead of running its own SELECT.
+    """
+
+    def _requested_pks(self, pk_field):
+        initial_data = getattr(self.root, "initial_data", None)
+        items = initial_data if isinstance(initial_data, list) else [initial_data]
+        pks = set()
+        for item in items:
+            if not isinstance(item, Mapping) or self.field_name not in item:
+                continue
+            try:
+                pks.add(pk_field.to_python(item[self.field_name]))
+            except DjangoValidationError:
+                continue
+        return pks
+
+    def to_internal_value(self, data):
+        if self.pk_field is not None:
+            data = self.pk_field.to_internal_value(data)
+        if isinstance(data, bool):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+
+        queryset = self.get_queryset()
+        pk_field = queryset.model._meta.pk
+        try:
+            pk = pk_field.to_python(data)
+        except DjangoValidationError:
+            self.fail("incorrect_type", data_type=type(data).__name__)
+
+        cache = self.context.setdefault("_batch_pk_cache", {}).setdefault(self.field_name, {})
+        if pk not in cache:
+            pending = (self._requested_pks(pk_field) - cache.keys()) | {pk}
+            objects = queryset.in_bulk(pending)
+            for pending_pk in pending:
+                cache[pending_pk] = objects.get(pending_pk)
+
+        if cache[pk] is None:
+            self.fail("does_not_exist", pk_value=data)
+        return cache[pk]
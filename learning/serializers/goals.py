@@ -1,5 +1,6 @@
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
-from drf_spectacular.utils import extend_schema_field
+from rest_framework.settings import api_settings
 from learning.models import Goal, UserGoal
 
 
@@ -7,7 +8,7 @@ class GoalSerializer(serializers.ModelSerializer):
     """
     Base serializer for Goal model.
     """
-    user_count = serializers.SerializerMethodField()
+    user_count = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = Goal
@@ -21,18 +22,13 @@ class GoalSerializer(serializers.ModelSerializer):
             "user_count",
         ]
         read_only_fields = ["id", "created_at", "updated_at", "user_count"]
-    
-    @extend_schema_field(serializers.IntegerField)
-    def get_user_count(self, obj) -> int:
-        """Return the number of users with this goal."""
-        return obj.user_goals.count()
 
 
 class GoalListSerializer(serializers.ModelSerializer):
     """
     Lightweight serializer for Goal list view.
     """
-    user_count = serializers.SerializerMethodField()
+    user_count = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = Goal
@@ -44,19 +40,14 @@ class GoalListSerializer(serializers.ModelSerializer):
             "user_count",
         ]
         read_only_fields = ["id", "user_count"]
-    
-    @extend_schema_field(serializers.IntegerField)
-    def get_user_count(self, obj) -> int:
-        """Return the number of users with this goal."""
-        return obj.user_goals.count()
 
 
 class GoalDetailSerializer(serializers.ModelSerializer):
     """
     Detailed serializer for Goal with statistics.
     """
-    user_count = serializers.SerializerMethodField()
-    avg_target_value = serializers.SerializerMethodField()
+    user_count = serializers.IntegerField(read_only=True)
+    avg_target_value = serializers.FloatField(read_only=True)
     
     class Meta:
         model = Goal
@@ -71,18 +62,6 @@ class GoalDetailSerializer(serializers.ModelSerializer):
             "avg_target_value",
         ]
         read_only_fields = ["id", "created_at", "updated_at", "user_count", "avg_target_value"]
-    
-    @extend_schema_field(serializers.IntegerField)
-    def get_user_count(self, obj) -> int:
-        """Return the number of users with this goal."""
-        return obj.user_goals.count()
-    
-    @extend_schema_field(serializers.FloatField)
-    def get_avg_target_value(self, obj):
-        """Return the average target value for this goal."""
-        from django.db.models import Avg
-        result = obj.user_goals.aggregate(avg_value=Avg("target_value"))
-        return float(result["avg_value"]) if result["avg_value"] else 0.0
 
 
 class GoalCreateUpdateSerializer(serializers.ModelSerializer):
@@ -96,18 +75,9 @@ class GoalCreateUpdateSerializer(serializers.ModelSerializer):
             "name",
             "type",
         ]
-    
-    def validate_code(self, value):
-        """Validate that code is unique (except for updates)."""
-        if self.instance:
-            # Update case - allow same code
-            if Goal.objects.exclude(pk=self.instance.pk).filter(code=value).exists():
-                raise serializers.ValidationError("Goal with this code already exists.")
-        else:
-            # Create case
-            if Goal.objects.filter(code=value).exists():
-                raise serializers.ValidationError("Goal with this code already exists.")
-        return value
+        # Uniqueness is enforced by the database constraint on code,
+        # see the view's perform_create/perform_update.
+        extra_kwargs = {"code": {"validators": []}}
 
 
 class UserGoalSerializer(serializers.ModelSerializer):
@@ -141,6 +111,11 @@ class UserGoalListSerializer(serializers.ModelSerializer):
     """
     Lightweight serializer for UserGoal list view.
     """
+    prefetch_spec = {
+        # created_at is read by the list's cursor pagination
+        "only": ["id", "goal", "target_value", "target_date", "created_at", "goal__code", "goal__name"],
+    }
+    
     goal_code = serializers.CharField(source="goal.code", read_only=True)
     goal_name = serializers.CharField(source="goal.name", read_only=True)
     
@@ -198,23 +173,25 @@ class UserGoalCreateUpdateSerializer(serializers.ModelSerializer):
             "target_date",
         ]
     
-    def validate(self, attrs):
-        """Validate unique constraint for user and goal."""
-        user = self.context["request"].user
-        goal = attrs.get("goal")
-        
-        if self.instance:
-            # Update case
-            if UserGoal.objects.exclude(pk=self.instance.pk).filter(user=user, goal=goal).exists():
-                raise serializers.ValidationError("You have already added this goal.")
-        else:
-            # Create case
-            if UserGoal.objects.filter(user=user, goal=goal).exists():
-                raise serializers.ValidationError("You have already added this goal.")
-        
-        return attrs
+    def _duplicate_error(self):
+        """Error raised when the user/goal unique constraint is violated."""
+        return serializers.ValidationError({
+            api_settings.NON_FIELD_ERRORS_KEY: ["You have already added this goal."]
+        })
     
     def create(self, validated_data):
         """Set user from request context."""
         validated_data["user"] = self.context["request"].user
-        return super().create(validated_data)
+        try:
+            with transaction.atomic():
+                return super().create(validated_data)
+        except IntegrityError:
+            raise self._duplicate_error()
+    
+    def update(self, instance, validated_data):
+        """Update, relying on the unique constraint for user and goal."""
+        try:
+            with transaction.atomic():
+                return super().update(instance, validated_data)
+        except IntegrityError:
+            raise self._duplicate_error()
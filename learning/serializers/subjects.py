@@ -1,14 +1,14 @@
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
-from drf_spectacular.utils import extend_schema_field
+from rest_framework.settings import api_settings
 from learning.models import Subject, UserSubject
+from learning.serializers.fields import BatchPrimaryKeyRelatedField
 
 
 class SubjectSerializer(serializers.ModelSerializer):
     """
     Base serializer for Subject model.
     """
-    user_count = serializers.SerializerMethodField()
-    
     class Meta:
         model = Subject
         fields = [
@@ -22,19 +22,12 @@ class SubjectSerializer(serializers.ModelSerializer):
             "user_count",
         ]
         read_only_fields = ["id", "created_at", "updated_at", "user_count"]
-    
-    @extend_schema_field(serializers.IntegerField)
-    def get_user_count(self, obj) -> int:
-        """Return the number of users studying this subject."""
-        return obj.user_subjects.count()
 
 
 class SubjectListSerializer(serializers.ModelSerializer):
     """
     Lightweight serializer for Subject list view.
     """
-    user_count = serializers.SerializerMethodField()
-    
     class Meta:
         model = Subject
         fields = [
@@ -46,20 +39,14 @@ class SubjectListSerializer(serializers.ModelSerializer):
             "user_count",
         ]
         read_only_fields = ["id", "user_count"]
-    
-    @extend_schema_field(serializers.IntegerField)
-    def get_user_count(self, obj) -> int:
-        """Return the number of users studying this subject."""
-        return obj.user_subjects.count()
 
 
 class SubjectDetailSerializer(serializers.ModelSerializer):
     """
     Detailed serializer for Subject with user statistics.
     """
-    user_count = serializers.SerializerMethodField()
-    learners_count = serializers.SerializerMethodField()
-    teachers_count = serializers.SerializerMethodField()
+    learners_count = serializers.IntegerField(read_only=True)
+    teachers_count = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = Subject
@@ -76,21 +63,6 @@ class SubjectDetailSerializer(serializers.ModelSerializer):
             "teachers_count",
         ]
         read_only_fields = ["id", "created_at", "updated_at", "user_count", "learners_count", "teachers_count"]
-    
-    @extend_schema_field(serializers.IntegerField)
-    def get_user_count(self, obj) -> int:
-        """Return the total number of users for this subject."""
-        return obj.user_subjects.count()
-    
-    @extend_schema_field(serializers.IntegerField)
-    def get_learners_count(self, obj) -> int:
-        """Return the number of learners for this subject."""
-        return obj.user_subjects.filter(intent__in=["learn", "both"]).count()
-    
-    @extend_schema_field(serializers.IntegerField)
-    def get_teachers_count(self, obj) -> int:
-        """Return the number of teachers for this subject."""
-        return obj.user_subjects.filter(intent__in=["teach", "both"]).count()
 
 
 class SubjectCreateUpdateSerializer(serializers.ModelSerializer):
@@ -105,18 +77,9 @@ class SubjectCreateUpdateSerializer(serializers.ModelSerializer):
             "name_en",
             "level",
         ]
-    
-    def validate_code(self, value):
-        """Validate that code is unique (except for updates)."""
-        if self.instance:
-            # Update case - allow same code
-            if Subject.objects.exclude(pk=self.instance.pk).filter(code=value).exists():
-                raise serializers.ValidationError("Subject with this code already exists.")
-        else:
-            # Create case
-            if Subject.objects.filter(code=value).exists():
-                raise serializers.ValidationError("Subject with this code already exists.")
-        return value
+        # Uniqueness is enforced by the database constraint on code,
+        # see the view's perform_create/perform_update.
+        extra_kwargs = {"code": {"validators": []}}
 
 
 class UserSubjectSerializer(serializers.ModelSerializer):
@@ -151,6 +114,11 @@ class UserSubjectListSerializer(serializers.ModelSerializer):
     """
     Lightweight serializer for UserSubject list view.
     """
+    prefetch_spec = {
+        # created_at is read by the list's cursor pagination
+        "only": ["id", "subject", "level", "intent", "created_at", "subject__code", "subject__name_en"],
+    }
+    
     subject_code = serializers.CharField(source="subject.code", read_only=True)
     subject_name_en = serializers.CharField(source="subject.name_en", read_only=True)
     
@@ -165,12 +133,35 @@ class UserSubjectListSerializer(serializers.ModelSerializer):
             "intent",
         ]
         read_only_fields = ["id", "subject_code", "subject_name_en"]
+    
+    def to_representation(self, instance):
+        """
+        Build the row directly instead of walking each field's source chain.
+        The declared fields still drive validation, the schema and the joins.
+        """
+        subject = instance.subject
+        return {
+            "id": instance.id,
+            "subject": instance.subject_id,
+            "subject_code": subject.code,
+            "subject_name_en": subject.name_en,
+            "level": instance.level,
+            "intent": instance.intent,
+        }
 
 
 class UserSubjectDetailSerializer(serializers.ModelSerializer):
     """
     Detailed serializer for UserSubject.
     """
+    prefetch_spec = {
+        "only": [
+            "id", "user", "subject", "level", "intent", "note", "created_at", "updated_at",
+            "user__email", "user__full_name",
+            "subject__code", "subject__name_vi", "subject__name_en", "subject__level",
+        ],
+    }
+    
     subject_code = serializers.CharField(source="subject.code", read_only=True)
     subject_name_vi = serializers.CharField(source="subject.name_vi", read_only=True)
     subject_name_en = serializers.CharField(source="subject.name_en", read_only=True)
@@ -197,38 +188,68 @@ class UserSubjectDetailSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
         read_only_fields = ["id", "user", "user_email", "user_full_name", "subject_code", "subject_name_vi", "subject_name_en", "subject_level", "created_at", "updated_at"]
+    
+    def to_representation(self, instance):
+        """Build the payload directly, see UserSubjectListSerializer."""
+        subject = instance.subject
+        user = instance.user
+        fields = self.fields
+        return {
+            "id": instance.id,
+            "user": instance.user_id,
+            "user_email": user.email,
+            "user_full_name": user.full_name,
+            "subject": instance.subject_id,
+            "subject_code": subject.code,
+            "subject_name_vi": subject.name_vi,
+            "subject_name_en": subject.name_en,
+            "subject_level": subject.level,
+            "level": instance.level,
+            "intent": instance.intent,
+            "note": instance.note,
+            "created_at": fields["created_at"].to_representation(instance.created_at),
+            "updated_at": fields["updated_at"].to_representation(instance.updated_at),
+        }
 
 
 class UserSubjectCreateUpdateSerializer(serializers.ModelSerializer):
     """
     Serializer for creating and updating UserSubject.
     """
+    user = serializers.HiddenField(default=serializers.CurrentUserDefault())
+    subject = BatchPrimaryKeyRelatedField(queryset=Subject.objects.all())
+    
     class Meta:
         model = UserSubject
         fields = [
+            "user",
             "subject",
             "level",
             "intent",
             "note",
         ]
+        # Uniqueness of (user, subject) is enforced by the database constraint
+        # instead of a UniqueTogetherValidator query, see create/update.
+        validators = []
     
-    def validate(self, attrs):
-        """Validate unique constraint for user and subject."""
-        user = self.context["request"].user
-        subject = attrs.get("subject")
-        
-        if self.instance:
-            # Update case
-            if UserSubject.objects.exclude(pk=self.instance.pk).filter(user=user, subject=subject).exists():
-                raise serializers.ValidationError("You have already added this subject.")
-        else:
-            # Create case
-            if UserSubject.objects.filter(user=user, subject=subject).exists():
-                raise serializers.ValidationError("You have already added this subject.")
-        
-        return attrs
+    def _duplicate_error(self):
+        """Error raised when the user/subject unique constraint is violated."""
+        return serializers.ValidationError({
+            api_settings.NON_FIELD_ERRORS_KEY: ["You have already added this subject."]
+        })
     
     def create(self, validated_data):
-        """Set user from request context."""
-        validated_data["user"] = self.context["request"].user
-        return super().create(validated_data)
+        """Create, relying on the unique constraint for user and subject."""
+        try:
+            with transaction.atomic():
+                return super().create(validated_data)
+        except IntegrityError:
+            raise self._duplicate_error()
+    
+    def update(self, instance, validated_data):
+        """Update, relying on the unique constraint for user and subject."""
+        try:
+            with transaction.atomic():
+                return super().update(instance, validated_data)
+        except IntegrityError:
+            raise self._duplicate_error()
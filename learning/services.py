@@ -0,0 +1,131 @@
+"""
+Service layer for learning app with Redis caching.
+"""
+from django.core.cache import cache
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Q
+from typing import Callable, Dict
+from urllib.parse import urlencode
+import hashlib
+import time
+
+from .models import UserSubject
+
+
+class LearningListCacheService:
+    """
+    Service for caching rendered JSON of goal and subject list responses in Redis.
+
+    Keys embed a per-resource generation counter instead of being deleted by
+    pattern: a write bumps the counter with INCR and later reads simply miss,
+    so invalidation never scans the keyspace. Old entries expire with their TTL.
+    """
+
+    # Cached resources
+    RESOURCE_GOALS = "goals"
+    RESOURCE_SUBJECTS = "subjects"
+
+    # Cache key prefixes
+    LIST_KEY = "{resource}:list:{generation}:{params_hash}"
+    GENERATION_KEY = "{resource}:list:generation"
+
+    @classmethod
+    def _get_cache_timeout(cls) -> int:
+        """Get cache timeout for rendered list responses."""
+        cache_ttl = getattr(settings, 'CACHE_TTL', {})
+        return cache_ttl.get('LEARNING_LISTS', 60)
+
+    @classmethod
+    def _hash_params(cls, query_params) -> str:
+        """Build a stable hash of request query parameters."""
+        encoded = urlencode(sorted(query_params.lists()), doseq=True)
+        return hashlib.md5(encoded.encode()).hexdigest()
+
+    @classmethod
+    def _get_generation(cls, resource: str) -> int:
+        """
+        Get a resource's generation counter, starting it if missing.
+        A fresh counter starts at the current time rather than 0, so a counter
+        lost to eviction can't line up with responses cached before it.
+        """
+        key = cls.GENERATION_KEY.format(resource=resource)
+        generation = cache.get(key)
+        if generation is None:
+            cache.add(key, time.time_ns(), None)
+            generation = cache.get(key)
+        return generation
+
+    @classmethod
+    def get_or_render(cls, resource: str, query_params, render: Callable[[], bytes]) -> bytes:
+        """Get cached response bytes, rendering and caching them on a miss."""
+        key = cls.LIST_KEY.format(
+            resource=resource,
+            generation=cls._get_generation(resource),
+            params_hash=cls._hash_params(query_params)
+        )
+        return cache.get_or_set(key, render, cls._get_cache_timeout())
+
+    @classmethod
+    def invalidate(cls, resource: str) -> None:
+        """Invalidate all cached list responses for a resource by bumping its generation."""
+        key = cls.GENERATION_KEY.format(resource=resource)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Missing counter: nothing can be cached under it yet
+            cache.add(key, time.time_ns(), None)
+
+    @classmethod
+    def invalidate_on_commit(cls, resource: str) -> None:
+        """
+        Invalidate cached list responses once the current transaction commits,
+        so concurrent readers can't re-cache uncommitted state.
+        """
+        transaction.on_commit(lambda: cls.invalidate(resource))
+
+
+class SubjectCountsCacheService:
+    """Service for caching per-subject user statistics in Redis."""
+
+    # Cache key prefixes
+    COUNTS_KEY = "subject:{subject_id}:counts"
+
+    @classmethod
+    def _get_cache_timeout(cls) -> int:
+        """Get cache timeout for subject statistics."""
+        cache_ttl = getattr(settings, 'CACHE_TTL', {})
+        return cache_ttl.get('SUBJECT_COUNTS', 300)
+
+    @classmethod
+    def get_counts(cls, subject_id: int) -> Dict[str, int]:
+        """
+        Get user, learner and teacher counts for a subject.
+        Falls back to a single aggregate query on a cache miss and caches the result.
+        """
+        key = cls.COUNTS_KEY.format(subject_id=subject_id)
+        counts = cache.get(key)
+
+        if counts is None:
+            counts = UserSubject.objects.filter(subject_id=subject_id).aggregate(
+                user_count=Count("pk"),
+                learners_count=Count(
+                    "pk", filter=Q(intent__in=[UserSubject.INTENT_LEARN, UserSubject.INTENT_BOTH])
+                ),
+                teachers_count=Count(
+                    "pk", filter=Q(intent__in=[UserSubject.INTENT_TEACH, UserSubject.INTENT_BOTH])
+                ),
+            )
+            cache.set(key, counts, cls._get_cache_timeout())
+
+        return counts
+
+    @classmethod
+    def invalidate(cls, subject_id: int) -> None:
+        """Invalidate cached statistics for a subject."""
+        cache.delete(cls.COUNTS_KEY.format(subject_id=subject_id))
+
+    @classmethod
+    def invalidate_on_commit(cls, subject_id: int) -> None:
+        """Invalidate cached statistics for a subject once the current transaction commits."""
+        transaction.on_commit(lambda: cls.invalidate(subject_id))
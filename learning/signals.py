@@ -0,0 +1,41 @@
+"""
+Signal handlers for learning app.
+"""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import Goal, Subject, UserGoal, UserSubject
+from .services import LearningListCacheService, SubjectCountsCacheService
+
+
+@receiver(post_save, sender=Goal)
+@receiver(post_delete, sender=Goal)
+@receiver(post_save, sender=UserGoal)
+@receiver(post_delete, sender=UserGoal)
+def invalidate_goal_list_cache(sender, instance, **kwargs):
+    """Drop cached goal lists whenever a goal or its user count changes."""
+    LearningListCacheService.invalidate_on_commit(LearningListCacheService.RESOURCE_GOALS)
+
+
+@receiver(post_save, sender=Subject)
+@receiver(post_delete, sender=Subject)
+@receiver(post_save, sender=UserSubject)
+@receiver(post_delete, sender=UserSubject)
+def invalidate_subject_list_cache(sender, instance, **kwargs):
+    """Drop cached subject lists whenever a subject or its user count changes."""
+    LearningListCacheService.invalidate_on_commit(LearningListCacheService.RESOURCE_SUBJECTS)
+
+
+@receiver(post_save, sender=UserSubject)
+@receiver(post_delete, sender=UserSubject)
+def invalidate_subject_counts_cache(sender, instance, **kwargs):
+    """
+    Drop the cached statistics of the subject a user subject points at, and of
+    the subject it pointed at before if an update moved it.
+    """
+    SubjectCountsCacheService.invalidate_on_commit(instance.subject_id)
+    loaded_subject_id = getattr(instance, "_loaded_subject_id", None)
+    if loaded_subject_id is not None and loaded_subject_id != instance.subject_id:
+        SubjectCountsCacheService.invalidate_on_commit(loaded_subject_id)
+    # Later saves of the same instance compare against what is now stored
+    instance._loaded_subject_id = instance.subject_id
@@ -0,0 +1,38 @@
+from types import SimpleNamespace
+
+from rest_framework import filters
+
+
+class RelatedSubquerySearchFilter(filters.SearchFilter):
+    """
+    SearchFilter for search_fields that all go through one forward relation,
+    e.g. ["subject__code", "subject__name_en"].
+
+    The terms are matched against the related table in a subquery
+    (subject_id IN (SELECT id FROM subjects WHERE ...)). The list query then
+    doesn't join the related rows, and the related table's own search
+    indexes can be used.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        search_fields = self.get_search_fields(view, request)
+        if not search_fields or not self.get_search_terms(request):
+            return queryset
+
+        lookups = [field.lstrip("^=@$") for field in search_fields]
+        relations = {lookup.split("__", 1)[0] for lookup in lookups}
+        if len(relations) != 1 or any("__" not in lookup for lookup in lookups):
+            return super().filter_queryset(request, queryset, view)
+
+        relation = relations.pop()
+        related_model = queryset.model._meta.get_field(relation).related_model
+        related_search_fields = [
+            field[:len(field) - len(lookup)] + lookup.split("__", 1)[1]
+            for field, lookup in zip(search_fields, lookups)
+        ]
+        related = super().filter_queryset(
+            request,
+            related_model._default_manager.all(),
+            SimpleNamespace(search_fields=related_search_fields),
+        )
+        return queryset.filter(**{f"{relation}__in": related.values("pk")})
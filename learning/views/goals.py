@@ -1,7 +1,16 @@
+from django.db import IntegrityError, transaction
+from django.db.models import Avg, Count, FloatField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.http import HttpResponse
 from rest_framework import generics, filters
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
+from drf_orjson_renderer.renderers import ORJSONRenderer
 
 from learning.models import Goal, UserGoal
+from learning.services import LearningListCacheService
+from learning.views.mixins import SerializerSpecQuerysetMixin, memoize_per_method
+from learning.views.pagination import CreatedAtCursorPagination
 from learning.serializers import (
     GoalListSerializer,
     GoalDetailSerializer,
@@ -26,6 +35,32 @@ from learning.schema import (
 )
 
 
+# Fields read by GoalListSerializer, plus created_at for the cursor position
+GOAL_LIST_FIELDS = ("id", "code", "name", "type", "created_at")
+
+# Users per goal as a correlated subquery. Unlike Count("user_goals")
+# it adds no join or GROUP BY, so the paginator's count() stays a plain COUNT(*)
+GOAL_USER_COUNT_SUBQUERY = Coalesce(
+    Subquery(
+        UserGoal.objects.filter(
+            goal=OuterRef("pk")
+        ).order_by().values("goal").annotate(
+            count=Count("pk")
+        ).values("count")[:1]
+    ),
+    0
+)
+
+
+def _save_unique_code(serializer):
+    """Save a goal, reporting a duplicate code as a validation error."""
+    try:
+        with transaction.atomic():
+            serializer.save()
+    except IntegrityError:
+        raise ValidationError({"code": ["Goal with this code already exists."]})
+
+
 class GoalListCreateAPIView(generics.ListCreateAPIView):
     """
     API view to list all goals or create a new goal.
@@ -33,11 +68,18 @@ class GoalListCreateAPIView(generics.ListCreateAPIView):
     GET: List all goals with pagination and search (requires authentication)
     POST: Create a new goal (requires authentication)
     """
-    queryset = Goal.objects.all().order_by("-created_at")
+    queryset = Goal.objects.only(*GOAL_LIST_FIELDS).annotate(
+        user_count=GOAL_USER_COUNT_SUBQUERY
+    ).order_by("-created_at")
     permission_classes = [IsAuthenticated]
+    pagination_class = CreatedAtCursorPagination
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ["code", "name"]
-    ordering_fields = ["code", "name", "type", "created_at"]
+    # Cursor pagination keys on the first ordering column, so only unique or
+    # near-unique columns are offered (ties are stepped over with an OFFSET)
+    ordering_fields = ["code", "created_at"]
+    # Default ordering, also the cursor ordering when no ?ordering is given
+    ordering = CreatedAtCursorPagination.ordering
     
     @goal_list_schema
     def get(self, request, *args, **kwargs):
@@ -47,12 +89,28 @@ class GoalListCreateAPIView(generics.ListCreateAPIView):
     def post(self, request, *args, **kwargs):
         return super().post(request, *args, **kwargs)
     
+    @memoize_per_method
     def get_serializer_class(self):
         """Use different serializers for list and create."""
         if self.request.method == "POST":
             return GoalCreateUpdateSerializer
         return GoalListSerializer
     
+    def list(self, request, *args, **kwargs):
+        """List goals from the short-lived response cache."""
+        content = LearningListCacheService.get_or_render(
+            LearningListCacheService.RESOURCE_GOALS,
+            request.query_params,
+            lambda: ORJSONRenderer().render(
+                super(GoalListCreateAPIView, self).list(request, *args, **kwargs).data
+            )
+        )
+        return HttpResponse(content, content_type="application/json")
+    
+    def perform_create(self, serializer):
+        """Create, relying on the unique constraint on code."""
+        _save_unique_code(serializer)
+    
     def get_queryset(self):
         """
         Optionally filter goals by type.
@@ -62,6 +120,9 @@ class GoalListCreateAPIView(generics.ListCreateAPIView):
         # Filter by type
         goal_type = self.request.query_params.get("type", None)
         if goal_type:
+            # Codes outside the choices can't be stored, so they match nothing
+            if goal_type not in dict(Goal.TYPE_CHOICES):
+                return queryset.none()
             queryset = queryset.filter(type=goal_type)
         
         return queryset
@@ -75,7 +136,13 @@ class GoalRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
     PUT/PATCH: Update a goal (requires authentication)
     DELETE: Delete a goal (requires authentication)
     """
-    queryset = Goal.objects.all()
+    queryset = Goal.objects.annotate(
+        user_count=Count("user_goals"),
+        avg_target_value=Coalesce(
+            Avg("user_goals__target_value", output_field=FloatField()),
+            Value(0.0)
+        ),
+    )
     permission_classes = [IsAuthenticated]
     lookup_field = "pk"
     
@@ -95,24 +162,34 @@ class GoalRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
     def delete(self, request, *args, **kwargs):
         return super().delete(request, *args, **kwargs)
     
+    @memoize_per_method
     def get_serializer_class(self):
         """Use different serializers for retrieve and update."""
         if self.request.method in ["PUT", "PATCH"]:
             return GoalCreateUpdateSerializer
         return GoalDetailSerializer
+    
+    def perform_update(self, serializer):
+        """Update, relying on the unique constraint on code."""
+        _save_unique_code(serializer)
 
 
-class UserGoalListCreateAPIView(generics.ListCreateAPIView):
+class UserGoalListCreateAPIView(SerializerSpecQuerysetMixin, generics.ListCreateAPIView):
     """
     API view to list all user goals or create a new user goal.
     
     GET: List all user goals for the authenticated user (requires authentication)
     POST: Create a new user goal (requires authentication)
     """
+    queryset = UserGoal.objects.all()
     permission_classes = [IsAuthenticated]
+    pagination_class = CreatedAtCursorPagination
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ["goal__code", "goal__name"]
-    ordering_fields = ["target_value", "target_date", "created_at"]
+    # Only near-unique columns suit the cursor (see GoalListCreateAPIView)
+    ordering_fields = ["created_at"]
+    # Default ordering, also the cursor ordering when no ?ordering is given
+    ordering = CreatedAtCursorPagination.ordering
     
     @user_goal_list_schema
     def get(self, request, *args, **kwargs):
@@ -122,6 +199,7 @@ class UserGoalListCreateAPIView(generics.ListCreateAPIView):
     def post(self, request, *args, **kwargs):
         return super().post(request, *args, **kwargs)
     
+    @memoize_per_method
     def get_serializer_class(self):
         """Use different serializers for list and create."""
         if self.request.method == "POST":
@@ -133,17 +211,20 @@ class UserGoalListCreateAPIView(generics.ListCreateAPIView):
         Return user goals for the authenticated user.
         Optionally filter by goal type.
         """
-        queryset = UserGoal.objects.filter(user=self.request.user).select_related("goal").order_by("-created_at")
+        queryset = super().get_queryset().filter(user=self.request.user).order_by("-created_at")
         
         # Filter by goal type
         goal_type = self.request.query_params.get("type", None)
         if goal_type:
+            # Codes outside the choices can't be stored, so they match nothing
+            if goal_type not in dict(Goal.TYPE_CHOICES):
+                return queryset.none()
             queryset = queryset.filter(goal__type=goal_type)
         
         return queryset
 
 
-class UserGoalRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
+class UserGoalRetrieveUpdateDestroyAPIView(SerializerSpecQuerysetMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     API view to retrieve, update or delete a user goal.
     
@@ -151,6 +232,7 @@ class UserGoalRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView
     PUT/PATCH: Update a user goal (requires authentication)
     DELETE: Delete a user goal (requires authentication)
     """
+    queryset = UserGoal.objects.all()
     permission_classes = [IsAuthenticated]
     lookup_field = "pk"
     
@@ -170,6 +252,7 @@ class UserGoalRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView
     def delete(self, request, *args, **kwargs):
         return super().delete(request, *args, **kwargs)
     
+    @memoize_per_method
     def get_serializer_class(self):
         """Use different serializers for retrieve and update."""
         if self.request.method in ["PUT", "PATCH"]:
@@ -178,4 +261,4 @@ class UserGoalRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView
     
     def get_queryset(self):
         """Return user goals for the authenticated user."""
-        return UserGoal.objects.filter(user=self.request.user).select_related("goal", "user")
+        return super().get_queryset().filter(user=self.request.user)
@@ -0,0 +1,96 @@
+from functools import lru_cache, wraps
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+
+
+@lru_cache(maxsize=None)
+def related_lookups_for_serializer(serializer_class):
+    """
+    Work out the select_related / prefetch_related lookups a ModelSerializer needs
+    from its dotted `source`s (e.g. source="subject.code") and nested serializers.
+    Computed once per serializer class.
+    """
+    model = serializer_class.Meta.model
+    select_related, prefetch_related = set(), set()
+
+    for field in serializer_class().fields.values():
+        if field.source == "*":
+            continue
+        if isinstance(field, serializers.BaseSerializer):
+            path = field.source.split(".")
+        else:
+            path = field.source.split(".")[:-1]
+        if not path:
+            continue
+
+        # Follow the path while it stays on single-valued relations
+        current, single_valued = model, True
+        for name in path:
+            try:
+                relation = current._meta.get_field(name)
+            except FieldDoesNotExist:
+                # Properties and methods can't be joined
+                break
+            if not relation.is_relation:
+                break
+            single_valued = single_valued and (relation.many_to_one or relation.one_to_one)
+            current = relation.related_model
+        else:
+            lookup = "__".join(path)
+            many = not single_valued or isinstance(field, serializers.ListSerializer)
+            (prefetch_related if many else select_related).add(lookup)
+
+    return sorted(select_related), sorted(prefetch_related)
+
+
+def memoize_per_method(method):
+    """
+    Cache a view method's result on the view instance, per HTTP method.
+
+    DRF calls get_serializer_class several times per request. Keying on the
+    request method keeps the browsable API's form rendering correct, as it
+    temporarily overrides request.method on the same view.
+    """
+    attr = f"_{method.__name__}_cache"
+
+    @wraps(method)
+    def wrapper(self):
+        cache = self.__dict__.setdefault(attr, {})
+        key = self.request.method if self.request is not None else None
+        if key not in cache:
+            cache[key] = method(self)
+        return cache[key]
+
+    return wrapper
+
+
+class SerializerSpecQuerysetMixin:
+    """
+    Shape the view's queryset from the serializer in use.
+
+    Joins are derived from the serializer's dotted sources, so adding a field
+    like source="goal.code" can't silently reintroduce an N+1. A serializer may
+    also declare a `prefetch_spec`, e.g. `{"only": ["id", "subject__code"]}`,
+    to restrict the columns loaded or to override the derived select_related.
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        serializer_class = self.get_serializer_class()
+        spec = getattr(serializer_class, "prefetch_spec", None) or {}
+
+        if issubclass(serializer_class, serializers.ModelSerializer):
+            select_related, prefetch_related = related_lookups_for_serializer(serializer_class)
+        else:
+            select_related, prefetch_related = [], []
+        select_related = spec.get("select_related", select_related)
+
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+        if spec.get("only"):
+            queryset = queryset.only(*spec["only"])
+
+        return queryset
@@ -1,7 +1,16 @@
+from django.db import IntegrityError, transaction
+from django.http import HttpResponse
 from rest_framework import generics, filters
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from drf_orjson_renderer.renderers import ORJSONRenderer
 
 from learning.models import Subject, UserSubject
+from learning.services import LearningListCacheService, SubjectCountsCacheService
+from learning.views.filters import RelatedSubquerySearchFilter
+from learning.views.mixins import SerializerSpecQuerysetMixin, memoize_per_method
+from learning.views.pagination import CreatedAtCursorPagination
 from learning.serializers import (
     SubjectListSerializer,
     SubjectDetailSerializer,
@@ -26,6 +35,19 @@ from learning.schema import (
 )
 
 
+# Keys of a subject list row, matching SubjectListSerializer's fields
+SUBJECT_LIST_FIELDS = ("id", "code", "name_vi", "name_en", "level", "user_count")
+
+
+def _save_unique_code(serializer):
+    """Save a subject, reporting a duplicate code as a validation error."""
+    try:
+        with transaction.atomic():
+            serializer.save()
+    except IntegrityError:
+        raise ValidationError({"code": ["Subject with this code already exists."]})
+
+
 class SubjectListCreateAPIView(generics.ListCreateAPIView):
     """
     API view to list all subjects or create a new subject.
@@ -33,11 +55,16 @@ class SubjectListCreateAPIView(generics.ListCreateAPIView):
     GET: List all subjects with pagination and search (requires authentication)
     POST: Create a new subject (requires authentication)
     """
-    queryset = Subject.objects.all().order_by("-created_at")
+    queryset = Subject.objects.order_by("-created_at")
     permission_classes = [IsAuthenticated]
+    pagination_class = CreatedAtCursorPagination
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ["code", "name_vi", "name_en"]
-    ordering_fields = ["code", "name_en", "created_at"]
+    # Cursor pagination keys on the first ordering column, so only unique or
+    # near-unique columns are offered (ties are stepped over with an OFFSET)
+    ordering_fields = ["code", "created_at"]
+    # Default ordering, also the cursor ordering when no ?ordering is given
+    ordering = CreatedAtCursorPagination.ordering
     
     @subject_list_schema
     def get(self, request, *args, **kwargs):
@@ -47,12 +74,40 @@ class SubjectListCreateAPIView(generics.ListCreateAPIView):
     def post(self, request, *args, **kwargs):
         return super().post(request, *args, **kwargs)
     
+    @memoize_per_method
     def get_serializer_class(self):
         """Use different serializers for list and create."""
         if self.request.method == "POST":
             return SubjectCreateUpdateSerializer
         return SubjectListSerializer
     
+    def list(self, request, *args, **kwargs):
+        """List subjects from the short-lived response cache."""
+        content = LearningListCacheService.get_or_render(
+            LearningListCacheService.RESOURCE_SUBJECTS,
+            request.query_params,
+            self._render_list
+        )
+        return HttpResponse(content, content_type="application/json")
+    
+    def _render_list(self):
+        """
+        Render a page of subjects from .values() rows, skipping model
+        instantiation and SubjectListSerializer's per-field dispatch.
+        """
+        # The cursor paginator reads its ordering fields off each row,
+        # so the ?ordering fields are selected too and dropped afterwards
+        rows = self.filter_queryset(self.get_queryset()).values(
+            *dict.fromkeys(SUBJECT_LIST_FIELDS + tuple(self.ordering_fields))
+        )
+        page = self.paginate_queryset(rows)
+        data = [{field: row[field] for field in SUBJECT_LIST_FIELDS} for row in page]
+        return ORJSONRenderer().render(self.get_paginated_response(data).data)
+    
+    def perform_create(self, serializer):
+        """Create, relying on the unique constraint on code."""
+        _save_unique_code(serializer)
+    
     def get_queryset(self):
         """
         Optionally filter subjects by level.
@@ -62,6 +117,9 @@ class SubjectListCreateAPIView(generics.ListCreateAPIView):
         # Filter by level
         level = self.request.query_params.get("level", None)
         if level:
+            # Codes outside the choices can't be stored, so they match nothing
+            if level not in dict(Subject.LEVEL_CHOICES):
+                return queryset.none()
             queryset = queryset.filter(level=level)
         
         return queryset
@@ -95,24 +153,42 @@ class SubjectRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView)
     def delete(self, request, *args, **kwargs):
         return super().delete(request, *args, **kwargs)
     
+    @memoize_per_method
     def get_serializer_class(self):
         """Use different serializers for retrieve and update."""
         if self.request.method in ["PUT", "PATCH"]:
             return SubjectCreateUpdateSerializer
         return SubjectDetailSerializer
+    
+    def retrieve(self, request, *args, **kwargs):
+        """Retrieve a subject with its user statistics from the cache."""
+        instance = self.get_object()
+        for name, value in SubjectCountsCacheService.get_counts(instance.pk).items():
+            setattr(instance, name, value)
+        serializer = self.get_serializer(instance)
+        return Response(serializer.data)
+    
+    def perform_update(self, serializer):
+        """Update, relying on the unique constraint on code."""
+        _save_unique_code(serializer)
 
 
-class UserSubjectListCreateAPIView(generics.ListCreateAPIView):
+class UserSubjectListCreateAPIView(SerializerSpecQuerysetMixin, generics.ListCreateAPIView):
     """
     API view to list all user subjects or create a new user subject.
     
     GET: List all user subjects for the authenticated user (requires authentication)
     POST: Create a new user subject (requires authentication)
     """
+    queryset = UserSubject.objects.all()
     permission_classes = [IsAuthenticated]
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    pagination_class = CreatedAtCursorPagination
+    filter_backends = [RelatedSubquerySearchFilter, filters.OrderingFilter]
     search_fields = ["subject__code", "subject__name_vi", "subject__name_en"]
-    ordering_fields = ["level", "intent", "created_at"]
+    # Only near-unique columns suit the cursor (see SubjectListCreateAPIView)
+    ordering_fields = ["created_at"]
+    # Default ordering, also the cursor ordering when no ?ordering is given
+    ordering = CreatedAtCursorPagination.ordering
     
     @user_subject_list_schema
     def get(self, request, *args, **kwargs):
@@ -122,6 +198,7 @@ class UserSubjectListCreateAPIView(generics.ListCreateAPIView):
     def post(self, request, *args, **kwargs):
         return super().post(request, *args, **kwargs)
     
+    @memoize_per_method
     def get_serializer_class(self):
         """Use different serializers for list and create."""
         if self.request.method == "POST":
@@ -133,22 +210,27 @@ class UserSubjectListCreateAPIView(generics.ListCreateAPIView):
         Return user subjects for the authenticated user.
         Optionally filter by level or intent.
         """
-        queryset = UserSubject.objects.filter(user=self.request.user).select_related("subject").order_by("-created_at")
+        queryset = super().get_queryset().filter(user=self.request.user).order_by("-created_at")
         
         # Filter by level
         level = self.request.query_params.get("level", None)
         if level:
+            # Codes outside the choices can't be stored, so they match nothing
+            if level not in dict(UserSubject.LEVEL_CHOICES):
+                return queryset.none()
             queryset = queryset.filter(level=level)
         
         # Filter by intent
         intent = self.request.query_params.get("intent", None)
         if intent:
+            if intent not in dict(UserSubject.INTENT_CHOICES):
+                return queryset.none()
             queryset = queryset.filter(intent=intent)
         
         return queryset
 
 
-class UserSubjectRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
+class UserSubjectRetrieveUpdateDestroyAPIView(SerializerSpecQuerysetMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     API view to retrieve, update or delete a user subject.
     
@@ -156,6 +238,7 @@ class UserSubjectRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIV
     PUT/PATCH: Update a user subject (requires authentication)
     DELETE: Delete a user subject (requires authentication)
     """
+    queryset = UserSubject.objects.all()
     permission_classes = [IsAuthenticated]
     lookup_field = "pk"
     
@@ -175,6 +258,7 @@ class UserSubjectRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIV
     def delete(self, request, *args, **kwargs):
         return super().delete(request, *args, **kwargs)
     
+    @memoize_per_method
     def get_serializer_class(self):
         """Use different serializers for retrieve and update."""
         if self.request.method in ["PUT", "PATCH"]:
@@ -183,4 +267,4 @@ class UserSubjectRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIV
     
     def get_queryset(self):
         """Return user subjects for the authenticated user."""
-        return UserSubject.objects.filter(user=self.request.user).select_related("subject", "user")
+        return super().get_queryset().filter(user=self.request.user)
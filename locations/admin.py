@@ -1,4 +1,5 @@
 from django.contrib import admin
+from .functions import point_latitude, point_longitude
 from .models import School, City, LocationHistory
 
 
@@ -63,13 +64,19 @@ class LocationHistoryAdmin(admin.ModelAdmin):
     
     def get_location(self, obj):
         """Display location coordinates."""
-        if obj.geom_point:
-            return f"({obj.geom_point.y:.6f}, {obj.geom_point.x:.6f})"
+        if obj.lat is not None:
+            return f"({obj.lat:.6f}, {obj.lng:.6f})"
         return "N/A"
     get_location.short_description = "Location (Lat, Lng)"
     
     def get_queryset(self, request):
-        """Optimize queryset with select_related."""
+        """
+        Optimize queryset with select_related.
+        Coordinates are read in SQL so list rows don't parse geom_point through GEOS.
+        """
         qs = super().get_queryset(request)
-        return qs.select_related("user")
+        return qs.select_related("user").defer("geom_point").annotate(
+            lat=point_latitude(),
+            lng=point_longitude()
+        )
 
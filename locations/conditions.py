@@ -0,0 +1,84 @@
+"""
+ETag functions for conditional GETs on locations endpoints.
+
+Each function returns a fingerprint of everything the response is built
+from, computed with one aggregate query or a cached version counter, so an
+unchanged resource can be answered with 304 Not Modified before any
+serialization happens.
+"""
+import hashlib
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Max, Q
+
+from locations.models import City, School
+from users.models import User
+
+
+# Version of the city and school tables, bumped by locations.signals
+LOCATIONS_VERSION_KEY = "locations:version"
+
+
+def _etag(*parts):
+    return hashlib.md5("|".join(str(part) for part in parts).encode()).hexdigest()
+
+
+def locations_version():
+    """
+    Current version of the city and school tables, starting it if missing.
+    A fresh counter starts at the current time, so a counter lost to
+    eviction can't repeat a version a client already holds.
+    """
+    version = cache.get(LOCATIONS_VERSION_KEY)
+    if version is None:
+        cache.add(LOCATIONS_VERSION_KEY, time.time_ns(), None)
+        version = cache.get(LOCATIONS_VERSION_KEY)
+    return version
+
+
+def bump_locations_version_on_commit():
+    """
+    Advance the version once the current transaction commits, so a reader
+    can't pair the new version with the old rows.
+    """
+    def bump():
+        try:
+            cache.incr(LOCATIONS_VERSION_KEY)
+        except ValueError:
+            cache.add(LOCATIONS_VERSION_KEY, time.time_ns(), None)
+
+    transaction.on_commit(bump)
+
+
+def city_etag(request, pk):
+    """ETag for a city detail: the city row plus its schools (school_count)."""
+    state = City.objects.filter(pk=pk).aggregate(
+        updated_at=Max("updated_at"),
+        schools=Count("schools"),
+        schools_updated_at=Max("schools__updated_at"),
+    )
+    if state["updated_at"] is None:
+        # Unknown city, let the view answer 404
+        return None
+    return _etag(pk, *state.values())
+
+
+def city_list_etag(request, *args, **kwargs):
+    """
+    ETag for city lists: the query string plus the city and school tables'
+    version. Read from the cache, so it costs no table scan.
+    """
+    return _etag(request.get_full_path(), locations_version())
+
+
+def school_etag(request, pk):
+    """ETag for a school detail: the school row plus its active student count."""
+    state = School.objects.filter(pk=pk).aggregate(
+        updated_at=Max("updated_at"),
+        students=Count("students", filter=Q(students__status=User.STATUS_ACTIVE)),
+    )
+    if state["updated_at"] is None:
+        return None
+    return _etag(pk, *state.values())
@@ -0,0 +1,38 @@
+"""
+Database expressions for locations app.
+"""
+from django.contrib.gis.db import models as gis_models
+from django.db.models import DecimalField, FloatField, Func
+from django.db.models.functions import Cast, Round
+
+
+def point_coordinate(function, field="geom_point"):
+    """
+    Extract a coordinate of a point field in the database.
+    ST_X / ST_Y need geometry, so geography columns are cast first.
+    """
+    return Func(
+        Cast(field, output_field=gis_models.PointField(srid=4326)),
+        function=function,
+        output_field=FloatField()
+    )
+
+
+def point_latitude(field="geom_point"):
+    """Latitude (ST_Y) of a point field."""
+    return point_coordinate("ST_Y", field)
+
+
+def point_longitude(field="geom_point"):
+    """Longitude (ST_X) of a point field."""
+    return point_coordinate("ST_X", field)
+
+
+def distance_km(distance, precision=2):
+    """
+    Convert a Distance() expression (metres) to rounded kilometres in SQL.
+    The cast to numeric is needed because PostgreSQL only rounds numerics
+    to a given precision.
+    """
+    metres = Cast(distance, DecimalField(max_digits=14, decimal_places=3))
+    return Round(metres / 1000, precision)
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.7 on 2026-10-15 09:00
+
+import django.contrib.postgres.indexes
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('locations', '0003_add_gist_index_location_history'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='locationhistory',
+            name='idx_location_recorded_at',
+        ),
+        migrations.AlterField(
+            model_name='locationhistory',
+            name='recorded_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, help_text='Timestamp when the location was recorded'),
+        ),
+        migrations.AddIndex(
+            model_name='locationhistory',
+            index=django.contrib.postgres.indexes.BrinIndex(fields=['recorded_at'], name='brin_location_recorded_at', pages_per_range=128),
+        ),
+    ]
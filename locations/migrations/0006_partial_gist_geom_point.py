@@ -0,0 +1,33 @@
+# Generated by Django 5.2.7 on 2026-10-15 09:00
+
+import django.contrib.gis.db.models.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('locations', '0005_city_updated_at'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='city',
+            name='geom_point',
+            field=django.contrib.gis.db.models.fields.PointField(blank=True, geography=True, help_text='Geographic location of the city', null=True, spatial_index=False, srid=4326),
+        ),
+        migrations.AlterField(
+            model_name='school',
+            name='geom_point',
+            field=django.contrib.gis.db.models.fields.PointField(blank=True, geography=True, help_text='Geographic location of the school', null=True, spatial_index=False, srid=4326),
+        ),
+        migrations.AddIndex(
+            model_name='city',
+            index=django.contrib.postgres.indexes.GistIndex(condition=models.Q(('geom_point__isnull', False)), fields=['geom_point'], name='idx_cities_geom_point'),
+        ),
+        migrations.AddIndex(
+            model_name='school',
+            index=django.contrib.postgres.indexes.GistIndex(condition=models.Q(('geom_point__isnull', False)), fields=['geom_point'], name='idx_schools_geom_point'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-15 09:00
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('locations', '0006_partial_gist_geom_point'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='city',
+            index=models.Index(django.db.models.functions.text.Upper('name'), name='idx_cities_name_upper'),
+        ),
+    ]
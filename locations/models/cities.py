@@ -1,8 +1,12 @@
 from django.db import models
 from django.contrib.gis.db import models as gis_models
+from django.contrib.postgres.indexes import GinIndex, GistIndex, OpClass
+from django.db.models.functions import Upper
 
+from locations.models.mixins import GeoPointMixin
 
-class City(models.Model):
+
+class City(GeoPointMixin, models.Model):
     """
     City model for representing cities.
     """
@@ -12,13 +16,25 @@ class City(models.Model):
         srid=4326,
         null=True,
         blank=True,
+        spatial_index=False,  # Partial GIST index in Meta.indexes
         help_text="Geographic location of the city"
     )
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = "cities"
         indexes = [
             models.Index(fields=["name"], name="idx_cities_name"),
+            # Matches the UPPER(name) = UPPER(...) that name__iexact compiles to
+            models.Index(Upper("name"), name="idx_cities_name_upper"),
+            # Trigram index for icontains searches on the name (see School)
+            GinIndex(OpClass(Upper("name"), name="gin_trgm_ops"), name="idx_cities_name_trgm"),
+            # Rows without coordinates never match a proximity search
+            GistIndex(
+                fields=["geom_point"],
+                name="idx_cities_geom_point",
+                condition=models.Q(geom_point__isnull=False),
+            ),
         ]
         verbose_name = "City"
         verbose_name_plural = "Cities"
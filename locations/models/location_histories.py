@@ -1,5 +1,6 @@
 from django.db import models
 from django.contrib.gis.db import models as gis_models
+from django.contrib.postgres.indexes import BrinIndex
 from django.utils import timezone
 
 
@@ -22,7 +23,6 @@ class LocationHistory(models.Model):
     )
     recorded_at = models.DateTimeField(
         default=timezone.now,
-        db_index=True,
         help_text="Timestamp when the location was recorded"
     )
     accuracy = models.FloatField(
@@ -36,7 +36,9 @@ class LocationHistory(models.Model):
         db_table = "location_history"
         indexes = [
             models.Index(fields=["user", "-recorded_at"], name="idx_location_user_time"),
-            models.Index(fields=["recorded_at"], name="idx_location_recorded_at"),
+            # Rows are appended in recorded_at order, so a BRIN index covers
+            # time-range scans at a fraction of a B-tree's size
+            BrinIndex(fields=["recorded_at"], name="brin_location_recorded_at", pages_per_range=128),
             # GIST index for geom_point is created via migration
         ]
         ordering = ["-recorded_at"]
@@ -0,0 +1,12 @@
+from django.contrib.gis.geos import Point
+
+
+class GeoPointMixin:
+    """
+    Shared handling of the geom_point field for models located by lat/lng.
+    """
+
+    def set_location(self, latitude, longitude):
+        """Set geom_point from lat/lng. Leaves it unchanged unless both are given."""
+        if latitude is not None and longitude is not None:
+            self.geom_point = Point(longitude, latitude, srid=4326)
@@ -1,8 +1,12 @@
 from django.db import models
 from django.contrib.gis.db import models as gis_models
+from django.contrib.postgres.indexes import GinIndex, GistIndex, OpClass
+from django.db.models.functions import Upper
 
+from locations.models.mixins import GeoPointMixin
 
-class School(models.Model):
+
+class School(GeoPointMixin, models.Model):
     """
     School/Institution model for educational institutions.
     """
@@ -26,6 +30,7 @@ class School(models.Model):
         srid=4326,
         null=True,
         blank=True,
+        spatial_index=False,  # Partial GIST index in Meta.indexes
         help_text="Geographic location of the school"
     )
     
@@ -43,7 +48,19 @@ class School(models.Model):
         indexes = [
             models.Index(fields=["name"], name="idx_schools_name"),
             models.Index(fields=["city"], name="idx_schools_city"),
-            # GIST index for geom_point is created via migration
+            # Keyset pagination of the school list walks this index
+            models.Index(fields=["-created_at", "-id"], name="idx_schools_created_at_id"),
+            # Trigram indexes on UPPER(column) match the SQL Django emits for
+            # icontains, so ?search= can use them instead of a seq scan
+            GinIndex(OpClass(Upper("name"), name="gin_trgm_ops"), name="idx_schools_name_trgm"),
+            GinIndex(OpClass(Upper("short_name"), name="gin_trgm_ops"), name="idx_schools_short_name_trgm"),
+            GinIndex(OpClass(Upper("address"), name="gin_trgm_ops"), name="idx_schools_address_trgm"),
+            # Rows without coordinates never match a proximity search
+            GistIndex(
+                fields=["geom_point"],
+                name="idx_schools_geom_point",
+                condition=models.Q(geom_point__isnull=False),
+            ),
         ]
         verbose_name = "School"
         verbose_name_plural = "Schools"
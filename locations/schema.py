@@ -7,9 +7,11 @@ from rest_framework import serializers
 from .serializers import (
     SchoolListSerializer,
     SchoolDetailSerializer,
+    SchoolWithDistanceSerializer,
     SchoolCreateUpdateSerializer,
     CityListSerializer,
     CityDetailSerializer,
+    CityWithDistanceSerializer,
     CityCreateUpdateSerializer,
 )
 
@@ -23,6 +25,48 @@ ErrorResponseSerializer = inline_serializer(
 )
 
 
+def _radius_parameter(default_km):
+    """Build the `radius` query parameter with the view's default radius."""
+    return OpenApiParameter(
+        name="radius",
+        type=OpenApiTypes.FLOAT,
+        location=OpenApiParameter.QUERY,
+        description=f"Search radius in kilometers (default: {default_km})"
+    )
+
+
+# Shared query parameters
+PROXIMITY_LATITUDE_PARAMETER = OpenApiParameter(
+    name="lat",
+    type=OpenApiTypes.FLOAT,
+    location=OpenApiParameter.QUERY,
+    description="Latitude for proximity search"
+)
+
+PROXIMITY_LONGITUDE_PARAMETER = OpenApiParameter(
+    name="lng",
+    type=OpenApiTypes.FLOAT,
+    location=OpenApiParameter.QUERY,
+    description="Longitude for proximity search"
+)
+
+SEARCH_CENTER_LATITUDE_PARAMETER = OpenApiParameter(
+    name="lat",
+    type=OpenApiTypes.FLOAT,
+    location=OpenApiParameter.QUERY,
+    required=True,
+    description="Latitude of the search center"
+)
+
+SEARCH_CENTER_LONGITUDE_PARAMETER = OpenApiParameter(
+    name="lng",
+    type=OpenApiTypes.FLOAT,
+    location=OpenApiParameter.QUERY,
+    required=True,
+    description="Longitude of the search center"
+)
+
+
 # School List/Create schemas
 school_list_schema = extend_schema(
     summary="List schools",
@@ -40,29 +84,14 @@ school_list_schema = extend_schema(
             location=OpenApiParameter.QUERY,
             description="Filter schools by city name"
         ),
-        OpenApiParameter(
-            name="lat",
-            type=OpenApiTypes.FLOAT,
-            location=OpenApiParameter.QUERY,
-            description="Latitude for proximity search"
-        ),
-        OpenApiParameter(
-            name="lng",
-            type=OpenApiTypes.FLOAT,
-            location=OpenApiParameter.QUERY,
-            description="Longitude for proximity search"
-        ),
-        OpenApiParameter(
-            name="radius",
-            type=OpenApiTypes.FLOAT,
-            location=OpenApiParameter.QUERY,
-            description="Search radius in kilometers (default: 10)"
-        ),
+        PROXIMITY_LATITUDE_PARAMETER,
+        PROXIMITY_LONGITUDE_PARAMETER,
+        _radius_parameter(10),
         OpenApiParameter(
             name="ordering",
             type=OpenApiTypes.STR,
             location=OpenApiParameter.QUERY,
-            description="Order results by: name, city, created_at (prefix with - for descending)"
+            description="Order results by: name, created_at (prefix with - for descending)"
         ),
     ],
     responses={200: SchoolListSerializer(many=True)},
@@ -115,29 +144,12 @@ school_search_by_location_schema = extend_schema(
     summary="Search schools by location",
     description="Search for schools within a specified radius of a geographic location. Returns schools ordered by distance.",
     parameters=[
-        OpenApiParameter(
-            name="lat",
-            type=OpenApiTypes.FLOAT,
-            location=OpenApiParameter.QUERY,
-            required=True,
-            description="Latitude of the search center"
-        ),
-        OpenApiParameter(
-            name="lng",
-            type=OpenApiTypes.FLOAT,
-            location=OpenApiParameter.QUERY,
-            required=True,
-            description="Longitude of the search center"
-        ),
-        OpenApiParameter(
-            name="radius",
-            type=OpenApiTypes.FLOAT,
-            location=OpenApiParameter.QUERY,
-            description="Search radius in kilometers (default: 10)"
-        ),
+        SEARCH_CENTER_LATITUDE_PARAMETER,
+        SEARCH_CENTER_LONGITUDE_PARAMETER,
+        _radius_parameter(10),
     ],
     responses={
-        200: SchoolDetailSerializer(many=True),
+        200: SchoolWithDistanceSerializer(many=True),
         400: ErrorResponseSerializer,
     },
     tags=["Schools"]
@@ -176,24 +188,9 @@ city_list_schema = extend_schema(
             location=OpenApiParameter.QUERY,
             description="Search cities by name"
         ),
-        OpenApiParameter(
-            name="lat",
-            type=OpenApiTypes.FLOAT,
-            location=OpenApiParameter.QUERY,
-            description="Latitude for proximity search"
-        ),
-        OpenApiParameter(
-            name="lng",
-            type=OpenApiTypes.FLOAT,
-            location=OpenApiParameter.QUERY,
-            description="Longitude for proximity search"
-        ),
-        OpenApiParameter(
-            name="radius",
-            type=OpenApiTypes.FLOAT,
-            location=OpenApiParameter.QUERY,
-            description="Search radius in kilometers (default: 50)"
-        ),
+        PROXIMITY_LATITUDE_PARAMETER,
+        PROXIMITY_LONGITUDE_PARAMETER,
+        _radius_parameter(50),
         OpenApiParameter(
             name="ordering",
             type=OpenApiTypes.STR,
@@ -251,29 +248,12 @@ city_search_by_location_schema = extend_schema(
     summary="Search cities by location",
     description="Search for cities within a specified radius of a geographic location. Returns cities ordered by distance.",
     parameters=[
-        OpenApiParameter(
-            name="lat",
-            type=OpenApiTypes.FLOAT,
-            location=OpenApiParameter.QUERY,
-            required=True,
-            description="Latitude of the search center"
-        ),
-        OpenApiParameter(
-            name="lng",
-            type=OpenApiTypes.FLOAT,
-            location=OpenApiParameter.QUERY,
-            required=True,
-            description="Longitude of the search center"
-        ),
-        OpenApiParameter(
-            name="radius",
-            type=OpenApiTypes.FLOAT,
-            location=OpenApiParameter.QUERY,
-            description="Search radius in kilometers (default: 50)"
-        ),
+        SEARCH_CENTER_LATITUDE_PARAMETER,
+        SEARCH_CENTER_LONGITUDE_PARAMETER,
+        _radius_parameter(50),
     ],
     responses={
-        200: CityDetailSerializer(many=True),
+        200: CityWithDistanceSerializer(many=True),
         400: ErrorResponseSerializer,
     },
     tags=["Cities"]
@@ -2,22 +2,28 @@ from .schools import (
     SchoolSerializer,
     SchoolListSerializer,
     SchoolDetailSerializer,
+    SchoolWithDistanceSerializer,
     SchoolCreateUpdateSerializer,
 )
 from .cities import (
     CitySerializer,
     CityListSerializer,
     CityDetailSerializer,
+    CityWithDistanceSerializer,
     CityCreateUpdateSerializer,
 )
+from .proximity import ProximityQuerySerializer
 
 __all__ = [
     "SchoolSerializer",
     "SchoolListSerializer",
     "SchoolDetailSerializer",
+    "SchoolWithDistanceSerializer",
     "SchoolCreateUpdateSerializer",
     "CitySerializer",
     "CityListSerializer",
     "CityDetailSerializer",
+    "CityWithDistanceSerializer",
     "CityCreateUpdateSerializer",
+    "ProximityQuerySerializer",
 ]
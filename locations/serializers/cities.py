@@ -1,5 +1,4 @@
 from rest_framework import serializers
-from drf_spectacular.utils import extend_schema_field
 from locations.models import City
 
 
@@ -7,7 +6,7 @@ class CitySerializer(serializers.ModelSerializer):
     """
     Serializer for City model.
     """
-    school_count = serializers.SerializerMethodField()
+    school_count = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = City
@@ -17,18 +16,13 @@ class CitySerializer(serializers.ModelSerializer):
             "school_count",
         ]
         read_only_fields = ["id", "school_count"]
-    
-    @extend_schema_field(serializers.IntegerField)
-    def get_school_count(self, obj) -> int:
-        """Return the number of schools in this city."""
-        return obj.schools.count()
 
 
 class CityListSerializer(serializers.ModelSerializer):
     """
     Lightweight serializer for City list view.
     """
-    school_count = serializers.SerializerMethodField()
+    school_count = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = City
@@ -39,19 +33,23 @@ class CityListSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "school_count"]
     
-    @extend_schema_field(serializers.IntegerField)
-    def get_school_count(self, obj) -> int:
-        """Return the number of schools in this city."""
-        return obj.schools.count()
+    def to_representation(self, instance):
+        """Build the row directly, see SchoolListSerializer."""
+        return {
+            "id": instance.id,
+            "name": instance.name,
+            "school_count": instance.school_count,
+        }
 
 
 class CityDetailSerializer(serializers.ModelSerializer):
     """
     Detailed serializer for City with geographic data.
     """
-    school_count = serializers.SerializerMethodField()
-    latitude = serializers.SerializerMethodField()
-    longitude = serializers.SerializerMethodField()
+    school_count = serializers.IntegerField(read_only=True)
+    # Annotated in SQL by the views, see locations.functions.point_latitude
+    latitude = serializers.FloatField(source="lat", read_only=True)
+    longitude = serializers.FloatField(source="lng", read_only=True)
     
     class Meta:
         model = City
@@ -63,25 +61,17 @@ class CityDetailSerializer(serializers.ModelSerializer):
             "school_count",
         ]
         read_only_fields = ["id", "school_count", "latitude", "longitude"]
+
+
+class CityWithDistanceSerializer(CityDetailSerializer):
+    """
+    CityDetailSerializer with the distance to a searched location.
+    """
+    distance_km = serializers.FloatField(read_only=True)
     
-    @extend_schema_field(serializers.IntegerField)
-    def get_school_count(self, obj) -> int:
-        """Return the number of schools in this city."""
-        return obj.schools.count()
-    
-    @extend_schema_field(serializers.FloatField)
-    def get_latitude(self, obj):
-        """Extract latitude from geom_point."""
-        if obj.geom_point:
-            return obj.geom_point.y
-        return None
-    
-    @extend_schema_field(serializers.FloatField)
-    def get_longitude(self, obj):
-        """Extract longitude from geom_point."""
-        if obj.geom_point:
-            return obj.geom_point.x
-        return None
+    class Meta(CityDetailSerializer.Meta):
+        fields = CityDetailSerializer.Meta.fields + ["distance_km"]
+        read_only_fields = CityDetailSerializer.Meta.read_only_fields + ["distance_km"]
 
 
 class CityCreateUpdateSerializer(serializers.ModelSerializer):
@@ -103,31 +93,22 @@ class CityCreateUpdateSerializer(serializers.ModelSerializer):
     
     def create(self, validated_data):
         """Create a city with geographic point from lat/lng."""
-        from django.contrib.gis.geos import Point
-        
         latitude = validated_data.pop("latitude", None)
         longitude = validated_data.pop("longitude", None)
         
         city = City(**validated_data)
-        
-        if latitude is not None and longitude is not None:
-            city.geom_point = Point(longitude, latitude, srid=4326)
-        
+        city.set_location(latitude, longitude)
         city.save()
         return city
     
     def update(self, instance, validated_data):
         """Update a city with geographic point from lat/lng."""
-        from django.contrib.gis.geos import Point
-        
         latitude = validated_data.pop("latitude", None)
         longitude = validated_data.pop("longitude", None)
         
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
-        
-        if latitude is not None and longitude is not None:
-            instance.geom_point = Point(longitude, latitude, srid=4326)
+        instance.set_location(latitude, longitude)
         
         instance.save()
         return instance
@@ -0,0 +1,17 @@
+from django.contrib.gis.geos import Point
+from rest_framework import serializers
+
+
+class ProximityQuerySerializer(serializers.Serializer):
+    """
+    Validates and coerces the lat/lng/radius query parameters of proximity
+    searches. radius is optional, each view applies its own default.
+    """
+    lat = serializers.FloatField(min_value=-90, max_value=90)
+    lng = serializers.FloatField(min_value=-180, max_value=180)
+    radius = serializers.FloatField(required=False, min_value=0, max_value=500)
+    
+    @property
+    def point(self):
+        """The validated search center."""
+        return Point(self.validated_data["lng"], self.validated_data["lat"], srid=4326)
@@ -1,5 +1,4 @@
 from rest_framework import serializers
-from drf_spectacular.utils import extend_schema_field
 from locations.models import School
 
 
@@ -7,7 +6,7 @@ class SchoolSerializer(serializers.ModelSerializer):
     """
     Serializer for School model.
     """
-    student_count = serializers.SerializerMethodField()
+    student_count = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = School
@@ -25,18 +24,13 @@ class SchoolSerializer(serializers.ModelSerializer):
             "student_count",
         ]
         read_only_fields = ["id", "created_at", "updated_at", "student_count"]
-    
-    @extend_schema_field(serializers.IntegerField)
-    def get_student_count(self, obj) -> int:
-        """Return the number of students enrolled in this school."""
-        return obj.students.filter(status="active").count()
 
 
 class SchoolListSerializer(serializers.ModelSerializer):
     """
     Lightweight serializer for School list view.
     """
-    student_count = serializers.SerializerMethodField()
+    student_count = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = School
@@ -49,19 +43,28 @@ class SchoolListSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "student_count"]
     
-    @extend_schema_field(serializers.IntegerField)
-    def get_student_count(self, obj) -> int:
-        """Return the number of students enrolled in this school."""
-        return obj.students.filter(status="active").count()
+    def to_representation(self, instance):
+        """
+        Build the row directly instead of dispatching through each field.
+        The declared fields still drive the schema.
+        """
+        return {
+            "id": instance.id,
+            "name": instance.name,
+            "short_name": instance.short_name,
+            "city": instance.city_id,
+            "student_count": instance.student_count,
+        }
 
 
 class SchoolDetailSerializer(serializers.ModelSerializer):
     """
     Detailed serializer for School with geographic data.
     """
-    student_count = serializers.SerializerMethodField()
-    latitude = serializers.SerializerMethodField()
-    longitude = serializers.SerializerMethodField()
+    student_count = serializers.IntegerField(read_only=True)
+    # Annotated in SQL by the views, see locations.functions.point_latitude
+    latitude = serializers.FloatField(source="lat", read_only=True)
+    longitude = serializers.FloatField(source="lng", read_only=True)
     
     class Meta:
         model = School
@@ -81,25 +84,17 @@ class SchoolDetailSerializer(serializers.ModelSerializer):
             "student_count",
         ]
         read_only_fields = ["id", "created_at", "updated_at", "student_count", "latitude", "longitude"]
+
+
+class SchoolWithDistanceSerializer(SchoolDetailSerializer):
+    """
+    SchoolDetailSerializer with the distance to a searched location.
+    """
+    distance_km = serializers.FloatField(read_only=True)
     
-    @extend_schema_field(serializers.IntegerField)
-    def get_student_count(self, obj) -> int:
-        """Return the number of students enrolled in this school."""
-        return obj.students.filter(status="active").count()
-    
-    @extend_schema_field(serializers.FloatField)
-    def get_latitude(self, obj):
-        """Extract latitude from geom_point."""
-        if obj.geom_point:
-            return obj.geom_point.y
-        return None
-    
-    @extend_schema_field(serializers.FloatField)
-    def get_longitude(self, obj):
-        """Extract longitude from geom_point."""
-        if obj.geom_point:
-            return obj.geom_point.x
-        return None
+    class Meta(SchoolDetailSerializer.Meta):
+        fields = SchoolDetailSerializer.Meta.fields + ["distance_km"]
+        read_only_fields = SchoolDetailSerializer.Meta.read_only_fields + ["distance_km"]
 
 
 class SchoolCreateUpdateSerializer(serializers.ModelSerializer):
@@ -127,31 +122,22 @@ class SchoolCreateUpdateSerializer(serializers.ModelSerializer):
     
     def create(self, validated_data):
         """Create a school with geographic point from lat/lng."""
-        from django.contrib.gis.geos import Point
-        
         latitude = validated_data.pop("latitude", None)
         longitude = validated_data.pop("longitude", None)
         
         school = School(**validated_data)
-        
-        if latitude is not None and longitude is not None:
-            school.geom_point = Point(longitude, latitude, srid=4326)
-        
+        school.set_location(latitude, longitude)
         school.save()
         return school
     
     def update(self, instance, validated_data):
         """Update a school with geographic point from lat/lng."""
-        from django.contrib.gis.geos import Point
-        
         latitude = validated_data.pop("latitude", None)
         longitude = validated_data.pop("longitude", None)
         
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
-        
-        if latitude is not None and longitude is not None:
-            instance.geom_point = Point(longitude, latitude, srid=4326)
+        instance.set_location(latitude, longitude)
         
         instance.save()
         return instance
@@ -0,0 +1,17 @@
+"""
+Signal handlers for locations app.
+"""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from locations.conditions import bump_locations_version_on_commit
+from locations.models import City, School
+
+
+@receiver(post_save, sender=City)
+@receiver(post_delete, sender=City)
+@receiver(post_save, sender=School)
+@receiver(post_delete, sender=School)
+def bump_locations_version(sender, instance, **kwargs):
+    """Change the city list ETags whenever a city or school changes."""
+    bump_locations_version_on_commit()
@@ -1,15 +1,25 @@
+from drf_spectacular.utils import extend_schema_view
 from rest_framework import generics, filters
 from rest_framework.permissions import IsAuthenticated
-from django.contrib.gis.geos import Point
 from django.contrib.gis.db.models.functions import Distance
+from django.contrib.gis.measure import D
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from rest_framework.response import Response
 from rest_framework import status
 
-from locations.models import City
+from locations.conditions import city_etag, city_list_etag
+from locations.functions import distance_km, point_latitude, point_longitude
+from locations.models import City, School
+from locations.views.pagination import CachedCountPagination
 from locations.serializers import (
     CityListSerializer,
     CityDetailSerializer,
+    CityWithDistanceSerializer,
     CityCreateUpdateSerializer,
+    ProximityQuerySerializer,
 )
 from locations.schema import (
     city_list_schema,
@@ -22,6 +32,23 @@ from locations.schema import (
 )
 
 
+# Fields read by CityListSerializer
+CITY_LIST_FIELDS = ("id", "name")
+
+# Schools per city as a correlated subquery. Unlike Count("schools") it adds
+# no join or GROUP BY, so the paginator's count() stays a plain COUNT(*)
+CITY_SCHOOL_COUNT_SUBQUERY = Coalesce(
+    Subquery(
+        School.objects.filter(
+            city=OuterRef("pk")
+        ).order_by().values("city").annotate(
+            count=Count("pk")
+        ).values("count")[:1]
+    ),
+    0
+)
+
+
 class CityListCreateAPIView(generics.ListCreateAPIView):
     """
     API view to list all cities or create a new city.
@@ -29,13 +56,17 @@ class CityListCreateAPIView(generics.ListCreateAPIView):
     GET: List all cities with pagination and search (requires authentication)
     POST: Create a new city (requires authentication)
     """
-    queryset = City.objects.all().order_by("name")
+    queryset = City.objects.only(*CITY_LIST_FIELDS).annotate(
+        school_count=CITY_SCHOOL_COUNT_SUBQUERY
+    ).order_by("name")
     permission_classes = [IsAuthenticated]
+    pagination_class = CachedCountPagination
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ["name"]
     ordering_fields = ["name"]
     
     @city_list_schema
+    @method_decorator(condition(etag_func=city_list_etag))
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
     
@@ -56,18 +87,21 @@ class CityListCreateAPIView(generics.ListCreateAPIView):
         queryset = super().get_queryset()
         
         # Proximity search
-        latitude = self.request.query_params.get("lat", None)
-        longitude = self.request.query_params.get("lng", None)
-        radius_km = self.request.query_params.get("radius", 50)  # Default 50km
-        
-        if latitude and longitude:
-            try:
-                user_location = Point(float(longitude), float(latitude), srid=4326)
-                queryset = queryset.filter(geom_point__isnull=False).annotate(
-                    distance=Distance("geom_point", user_location)
-                ).filter(distance__lte=float(radius_km) * 1000).order_by("distance")
-            except (ValueError, TypeError):
-                pass
+        if "lat" in self.request.query_params or "lng" in self.request.query_params:
+            proximity = ProximityQuerySerializer(data=self.request.query_params)
+            if not proximity.is_valid():
+                # A malformed location must not fall back to an unfiltered list
+                return queryset.none()
+            user_location = proximity.point
+            radius_km = proximity.validated_data.get("radius", 50)  # Default 50km
+            # ST_DWithin uses the GIST index, so distances are only
+            # computed for the points inside the radius
+            queryset = queryset.filter(
+                geom_point__isnull=False,
+                geom_point__dwithin=(user_location, D(km=radius_km))
+            ).annotate(
+                distance=Distance("geom_point", user_location)
+            ).order_by("distance")
         
         return queryset
 
@@ -80,11 +114,16 @@ class CityRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
     PUT/PATCH: Update a city (requires authentication)
     DELETE: Delete a city (requires authentication)
     """
-    queryset = City.objects.all()
+    queryset = City.objects.annotate(
+        school_count=Count("schools"),
+        lat=point_latitude(),
+        lng=point_longitude()
+    )
     permission_classes = [IsAuthenticated]
     lookup_field = "pk"
     
     @city_retrieve_schema
+    @method_decorator(condition(etag_func=city_etag))
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
     
@@ -107,7 +146,7 @@ class CityRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
         return CityDetailSerializer
 
 
-@city_search_by_location_schema
+@extend_schema_view(get=city_search_by_location_schema)
 class CitySearchByLocationAPIView(generics.ListAPIView):
     """
     API view to search cities by geographic location.
@@ -118,30 +157,35 @@ class CitySearchByLocationAPIView(generics.ListAPIView):
     - radius: Search radius in kilometers (default: 50)
     (requires authentication)
     """
-    serializer_class = CityDetailSerializer
+    serializer_class = CityWithDistanceSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = CachedCountPagination
+    
+    @method_decorator(condition(etag_func=city_list_etag))
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
     
     def get_queryset(self):
         """Filter cities within radius of given location."""
-        latitude = self.request.query_params.get("lat")
-        longitude = self.request.query_params.get("lng")
-        radius_km = float(self.request.query_params.get("radius", 50))
-        
-        if not latitude or not longitude:
+        proximity = ProximityQuerySerializer(data=self.request.query_params)
+        if not proximity.is_valid():
             return City.objects.none()
         
-        try:
-            user_location = Point(float(longitude), float(latitude), srid=4326)
-            queryset = City.objects.filter(geom_point__isnull=False).annotate(
-                distance=Distance("geom_point", user_location)
-            ).filter(distance__lte=radius_km * 1000).order_by("distance")
-            
-            return queryset
-        except (ValueError, TypeError):
-            return City.objects.none()
+        user_location = proximity.point
+        radius_km = proximity.validated_data.get("radius", 50)
+        return City.objects.filter(
+            geom_point__isnull=False,
+            geom_point__dwithin=(user_location, D(km=radius_km))
+        ).defer("geom_point").annotate(
+            school_count=CITY_SCHOOL_COUNT_SUBQUERY,
+            lat=point_latitude(),
+            lng=point_longitude(),
+            distance=Distance("geom_point", user_location),
+            distance_km=distance_km("distance")
+        ).order_by("distance")
     
     def list(self, request, *args, **kwargs):
-        """Override to add distance information to response."""
+        """Override to validate the lat/lng parameters."""
         latitude = request.query_params.get("lat")
         longitude = request.query_params.get("lng")
         
@@ -151,26 +195,4 @@ class CitySearchByLocationAPIView(generics.ListAPIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        queryset = self.get_queryset()
-        page = self.paginate_queryset(queryset)
-        
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            data = serializer.data
-            
-            # Add distance information
-            for i, city in enumerate(page):
-                if hasattr(city, "distance"):
-                    data[i]["distance_km"] = round(city.distance.km, 2)
-            
-            return self.get_paginated_response(data)
-        
-        serializer = self.get_serializer(queryset, many=True)
-        data = serializer.data
-        
-        # Add distance information
-        for i, city in enumerate(queryset):
-            if hasattr(city, "distance"):
-                data[i]["distance_km"] = round(city.distance.km, 2)
-        
-        return Response(data)
+        return super().list(request, *args, **kwargs)
@@ -0,0 +1,69 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+COUNT_KEY = "pagination:count:{query_hash}"
+
+
+def count_cache_key(queryset):
+    """Cache key for a queryset's row count, or None if it can't be cached."""
+    try:
+        sql = str(queryset.query)
+    except (AttributeError, EmptyResultSet):
+        return None
+    return COUNT_KEY.format(query_hash=hashlib.md5(sql.encode()).hexdigest())
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator that caches the total row count per compiled query, so deep
+    pages of annotated or geo-filtered lists don't re-run COUNT(*).
+    """
+
+    @cached_property
+    def count(self):
+        key = count_cache_key(self.object_list)
+        if key is None:
+            return super().count
+
+        count = cache.get(key)
+        if count is None:
+            count = super().count
+            cache_ttl = getattr(settings, "CACHE_TTL", {})
+            cache.set(key, count, cache_ttl.get("PAGINATION_COUNTS", 300))
+        return count
+
+
+class CachedCountPagination(PageNumberPagination):
+    """
+    Page-number pagination with a cached total count.
+    The first page always recounts, so the count is refreshed whenever a
+    client starts paging through a list again.
+    """
+    django_paginator_class = CachedCountPaginator
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if request.query_params.get(self.page_query_param, "1") == "1":
+            key = count_cache_key(queryset)
+            if key is not None:
+                cache.delete(key)
+        return super().paginate_queryset(queryset, request, view)
+
+
+class NewestFirstCursorPagination(CursorPagination):
+    """
+    Keyset pagination, newest first, served by the (created_at DESC, id DESC)
+    index. Each page is a `WHERE created_at < cursor` range instead of an
+    OFFSET that rescans every skipped row.
+    """
+    ordering = ("-created_at", "-id")
+
+
+class DistanceCursorPagination(CursorPagination):
+    """Keyset pagination, nearest first, keyed on the `distance_km` annotation."""
+    ordering = ("distance_km", "id")
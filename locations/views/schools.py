@@ -1,15 +1,30 @@
+from drf_spectacular.utils import extend_schema_view
 from rest_framework import generics, filters
 from rest_framework.permissions import IsAuthenticated
-from django.contrib.gis.geos import Point
 from django.contrib.gis.db.models.functions import Distance
+from django.contrib.gis.measure import D
+from django.db.models import Count, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from rest_framework.response import Response
 from rest_framework import status
 
+from locations.conditions import school_etag
+from locations.functions import distance_km, point_latitude, point_longitude
 from locations.models import School
+from users.models import User
+from locations.views.pagination import (
+    CachedCountPagination,
+    NewestFirstCursorPagination,
+    DistanceCursorPagination,
+)
 from locations.serializers import (
     SchoolListSerializer,
     SchoolDetailSerializer,
+    SchoolWithDistanceSerializer,
     SchoolCreateUpdateSerializer,
+    ProximityQuerySerializer,
 )
 from locations.schema import (
     school_list_schema,
@@ -23,6 +38,24 @@ from locations.schema import (
 )
 
 
+# Fields read by SchoolListSerializer, plus created_at for the cursor position
+SCHOOL_LIST_FIELDS = ("id", "name", "short_name", "city", "created_at")
+
+# Active students per school as a correlated subquery. Unlike an annotated
+# Count("students") it adds no join or GROUP BY, so the paginator's count()
+# stays a plain COUNT(*)
+SCHOOL_STUDENT_COUNT_SUBQUERY = Coalesce(
+    Subquery(
+        User.objects.filter(
+            school=OuterRef("pk"), status=User.STATUS_ACTIVE
+        ).order_by().values("school").annotate(
+            count=Count("pk")
+        ).values("count")[:1]
+    ),
+    0
+)
+
+
 class SchoolListCreateAPIView(generics.ListCreateAPIView):
     """
     API view to list all schools or create a new school.
@@ -30,11 +63,17 @@ class SchoolListCreateAPIView(generics.ListCreateAPIView):
     GET: List all schools with pagination and search (requires authentication)
     POST: Create a new school (requires authentication)
     """
-    queryset = School.objects.all().order_by("-created_at")
+    queryset = School.objects.only(*SCHOOL_LIST_FIELDS).annotate(
+        student_count=SCHOOL_STUDENT_COUNT_SUBQUERY
+    )
     permission_classes = [IsAuthenticated]
+    pagination_class = NewestFirstCursorPagination
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
-    search_fields = ["name", "short_name", "city", "address"]
-    ordering_fields = ["name", "city", "created_at"]
+    search_fields = ["name", "short_name", "city__name", "address"]
+    # Cursor pagination needs non-null, near-unique orderings, so the
+    # nullable city FK is not offered
+    ordering_fields = ["name", "created_at"]
+    ordering = NewestFirstCursorPagination.ordering
     
     @school_list_schema
     def get(self, request, *args, **kwargs):
@@ -57,10 +96,10 @@ class SchoolListCreateAPIView(generics.ListCreateAPIView):
         """
         queryset = super().get_queryset()
         
-        # Filter by city
+        # Filter by city name, served by the idx_cities_name_trgm trigram index
         city = self.request.query_params.get("city", None)
         if city:
-            queryset = queryset.filter(city__icontains=city)
+            queryset = queryset.filter(city__name__icontains=city)
         
         # Filter by country
         country = self.request.query_params.get("country", None)
@@ -68,18 +107,24 @@ class SchoolListCreateAPIView(generics.ListCreateAPIView):
             queryset = queryset.filter(country__icontains=country)
         
         # Proximity search
-        latitude = self.request.query_params.get("lat", None)
-        longitude = self.request.query_params.get("lng", None)
-        radius_km = self.request.query_params.get("radius", 10)  # Default 10km
-        
-        if latitude and longitude:
-            try:
-                user_location = Point(float(longitude), float(latitude), srid=4326)
-                queryset = queryset.filter(geom_point__isnull=False).annotate(
-                    distance=Distance("geom_point", user_location)
-                ).filter(distance__lte=float(radius_km) * 1000).order_by("distance")
-            except (ValueError, TypeError):
-                pass
+        if "lat" in self.request.query_params or "lng" in self.request.query_params:
+            proximity = ProximityQuerySerializer(data=self.request.query_params)
+            if not proximity.is_valid():
+                # A malformed location must not fall back to an unfiltered list
+                return queryset.none()
+            user_location = proximity.point
+            radius_km = proximity.validated_data.get("radius", 10)  # Default 10km
+            # ST_DWithin uses the GIST index, so distances are only
+            # computed for the points inside the radius
+            queryset = queryset.filter(
+                geom_point__isnull=False,
+                geom_point__dwithin=(user_location, D(km=radius_km))
+            ).annotate(
+                distance=Distance("geom_point", user_location),
+                distance_km=distance_km("distance")
+            )
+            # Nearest first; the cursor then keys on distance_km
+            self.ordering = DistanceCursorPagination.ordering
         
         return queryset
 
@@ -92,11 +137,16 @@ class SchoolRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
     PUT/PATCH: Update a school (requires authentication)
     DELETE: Delete a school (requires authentication)
     """
-    queryset = School.objects.all()
+    queryset = School.objects.annotate(
+        student_count=Count("students", filter=Q(students__status=User.STATUS_ACTIVE)),
+        lat=point_latitude(),
+        lng=point_longitude()
+    )
     permission_classes = [IsAuthenticated]
     lookup_field = "pk"
     
     @school_retrieve_schema
+    @method_decorator(condition(etag_func=school_etag))
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
     
@@ -119,7 +169,7 @@ class SchoolRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
         return SchoolDetailSerializer
 
 
-@school_search_by_location_schema
+@extend_schema_view(get=school_search_by_location_schema)
 class SchoolSearchByLocationAPIView(generics.ListAPIView):
     """
     API view to search schools by geographic location.
@@ -130,30 +180,31 @@ class SchoolSearchByLocationAPIView(generics.ListAPIView):
     - radius: Search radius in kilometers (default: 10)
     (requires authentication)
     """
-    serializer_class = SchoolDetailSerializer
+    serializer_class = SchoolWithDistanceSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = DistanceCursorPagination
     
     def get_queryset(self):
         """Filter schools within radius of given location."""
-        latitude = self.request.query_params.get("lat")
-        longitude = self.request.query_params.get("lng")
-        radius_km = float(self.request.query_params.get("radius", 10))
-        
-        if not latitude or not longitude:
+        proximity = ProximityQuerySerializer(data=self.request.query_params)
+        if not proximity.is_valid():
             return School.objects.none()
         
-        try:
-            user_location = Point(float(longitude), float(latitude), srid=4326)
-            queryset = School.objects.filter(geom_point__isnull=False).annotate(
-                distance=Distance("geom_point", user_location)
-            ).filter(distance__lte=radius_km * 1000).order_by("distance")
-            
-            return queryset
-        except (ValueError, TypeError):
-            return School.objects.none()
+        user_location = proximity.point
+        radius_km = proximity.validated_data.get("radius", 10)
+        return School.objects.filter(
+            geom_point__isnull=False,
+            geom_point__dwithin=(user_location, D(km=radius_km))
+        ).defer("geom_point").annotate(
+            student_count=SCHOOL_STUDENT_COUNT_SUBQUERY,
+            lat=point_latitude(),
+            lng=point_longitude(),
+            distance=Distance("geom_point", user_location),
+            distance_km=distance_km("distance")
+        )
     
     def list(self, request, *args, **kwargs):
-        """Override to add distance information to response."""
+        """Override to validate the lat/lng parameters."""
         latitude = request.query_params.get("lat")
         longitude = request.query_params.get("lng")
         
@@ -163,32 +214,10 @@ class SchoolSearchByLocationAPIView(generics.ListAPIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        queryset = self.get_queryset()
-        page = self.paginate_queryset(queryset)
-        
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            data = serializer.data
-            
-            # Add distance information
-            for i, school in enumerate(page):
-                if hasattr(school, "distance"):
-                    data[i]["distance_km"] = round(school.distance.km, 2)
-            
-            return self.get_paginated_response(data)
-        
-        serializer = self.get_serializer(queryset, many=True)
-        data = serializer.data
-        
-        # Add distance information
-        for i, school in enumerate(queryset):
-            if hasattr(school, "distance"):
-                data[i]["distance_km"] = round(school.distance.km, 2)
-        
-        return Response(data)
+        return super().list(request, *args, **kwargs)
 
 
-@school_list_by_city_schema
+@extend_schema_view(get=school_list_by_city_schema)
 class SchoolListByCityAPIView(generics.ListAPIView):
     """
     API view to list schools grouped by city.
@@ -199,6 +228,7 @@ class SchoolListByCityAPIView(generics.ListAPIView):
     """
     serializer_class = SchoolListSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = CachedCountPagination
     
     def get_queryset(self):
         """Filter schools by city."""
@@ -207,7 +237,10 @@ class SchoolListByCityAPIView(generics.ListAPIView):
         if not city:
             return School.objects.none()
         
-        return School.objects.filter(city__icontains=city).order_by("name")
+        # Exact, case-insensitive city name match, served by idx_cities_name_upper
+        return School.objects.only(*SCHOOL_LIST_FIELDS).filter(city__name__iexact=city).annotate(
+            student_count=SCHOOL_STUDENT_COUNT_SUBQUERY
+        ).order_by("name")
     
     def list(self, request, *args, **kwargs):
         """Override to validate city parameter."""
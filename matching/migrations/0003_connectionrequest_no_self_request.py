@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-15 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('matching', '0002_remove_mutual_conversation_states'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='connectionrequest',
+            constraint=models.CheckConstraint(condition=models.Q(('sender', models.F('receiver')), _negated=True), name='chk_conn_req_no_self_request'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-15 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('matching', '0004_connection_user_order'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='connectionrequest',
+            name='state',
+            field=models.CharField(choices=[('pending', 'Pending'), ('accepted', 'Accepted'), ('rejected', 'Rejected'), ('blocked', 'Blocked')], default='pending', help_text='Current state of the connection request', max_length=20),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.7 on 2026-10-15 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('matching', '0005_connectionrequest_state_drop_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='connectionrequest',
+            name='sender_name',
+            field=models.CharField(blank=True, default='', editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='connectionrequest',
+            name='sender_avatar',
+            field=models.URLField(blank=True, editable=False, max_length=500, null=True),
+        ),
+        migrations.AddField(
+            model_name='connectionrequest',
+            name='receiver_name',
+            field=models.CharField(blank=True, default='', editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='connectionrequest',
+            name='receiver_avatar',
+            field=models.URLField(blank=True, editable=False, max_length=500, null=True),
+        ),
+        migrations.RunSQL(
+            sql="""
+                UPDATE connection_requests AS cr
+                SET sender_name = s.full_name,
+                    sender_avatar = s.avatar_url,
+                    receiver_name = r.full_name,
+                    receiver_avatar = r.avatar_url
+                FROM users AS s, users AS r
+                WHERE s.id = cr.sender_id AND r.id = cr.receiver_id
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.7 on 2026-10-15 09:00
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('matching', '0006_connectionrequest_user_snapshot'),
+    ]
+
+    operations = [
+        # Pairs that reconnected kept pointing at their first request; point
+        # them at the accepted one so get_connection() finds it
+        migrations.RunSQL(
+            sql="""
+                UPDATE connections AS c
+                SET connection_request_id = cr.id
+                FROM connection_requests AS cr
+                WHERE cr.state = 'accepted'
+                  AND LEAST(cr.sender_id, cr.receiver_id) = c.user1_id
+                  AND GREATEST(cr.sender_id, cr.receiver_id) = c.user2_id
+                  AND NOT EXISTS (
+                      SELECT 1 FROM connection_requests AS current
+                      WHERE current.id = c.connection_request_id
+                        AND current.state = 'accepted'
+                  )
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
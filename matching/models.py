@@ -52,7 +52,6 @@ class ConnectionRequest(models.Model):
         max_length=20,
         default=STATE_PENDING,
         choices=STATE_CHOICES,
-        db_index=True,
         help_text='Current state of the connection request'
     )
     
@@ -62,6 +61,13 @@ class ConnectionRequest(models.Model):
         help_text='Optional message from sender'
     )
     
+    # Denormalized from the users for ConnectionRequestListSerializer, so the
+    # request lists need no join. Kept in sync by save() and matching.signals
+    sender_name = models.CharField(max_length=255, blank=True, default='', editable=False)
+    sender_avatar = models.URLField(max_length=500, null=True, blank=True, editable=False)
+    receiver_name = models.CharField(max_length=255, blank=True, default='', editable=False)
+    receiver_avatar = models.URLField(max_length=500, null=True, blank=True, editable=False)
+    
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -71,6 +77,12 @@ class ConnectionRequest(models.Model):
     class Meta:
         db_table = 'connection_requests'
         unique_together = [['sender', 'receiver']]
+        constraints = [
+            models.CheckConstraint(
+                condition=~models.Q(sender=models.F('receiver')),
+                name='chk_conn_req_no_self_request'
+            ),
+        ]
         indexes = [
             models.Index(fields=['sender', 'state'], name='idx_conn_req_sender_state'),
             models.Index(fields=['receiver', 'state'], name='idx_conn_req_receiver_state'),
@@ -89,56 +101,70 @@ class ConnectionRequest(models.Model):
             raise ValidationError("Cannot send connection request to yourself")
     
     def save(self, *args, **kwargs):
-        """Override save to run validation."""
+        """Override save to run validation and snapshot the users' names and avatars."""
         self.clean()
+        if self._state.adding:
+            self.sender_name = self.sender.full_name
+            self.sender_avatar = self.sender.avatar_url
+            self.receiver_name = self.receiver.full_name
+            self.receiver_avatar = self.receiver.avatar_url
         super().save(*args, **kwargs)
     
-    def _transition_state(self, target_state):
+    def _transition_state(self, target_state, **fields):
         """
         Internal method to handle state transitions.
-        Validates that the transition is allowed before changing state.
+        Validates that the transition is allowed, then applies it with a single
+        UPDATE conditioned on the current state, so concurrent transitions of
+        the same request can't both succeed.
         """
+        from django.utils import timezone
         if target_state not in self.STATE_TRANSITIONS.get(self.state, []):
             raise ValidationError(
                 f"Cannot transition from {self.state} to {target_state}"
             )
-        self.state = target_state
+        fields.update(state=target_state, updated_at=timezone.now())
+        updated = type(self).objects.filter(
+            pk=self.pk, state=self.state
+        ).update(**fields)
+        if not updated:
+            raise ValidationError(
+                f"Connection request is no longer {self.state}"
+            )
+        for name, value in fields.items():
+            setattr(self, name, value)
     
     # State Transition Methods
     def accept(self):
         """Accept the connection request and create connection immediately."""
         from django.utils import timezone
-        self._transition_state(self.STATE_ACCEPTED)
-        self.accepted_at = timezone.now()
-        self.save()
+        self._transition_state(self.STATE_ACCEPTED, accepted_at=timezone.now())
     
     def reject(self):
         """Reject the connection request."""
         from django.utils import timezone
-        self._transition_state(self.STATE_REJECTED)
-        self.rejected_at = timezone.now()
-        self.save()
+        self._transition_state(self.STATE_REJECTED, rejected_at=timezone.now())
     
     def block(self):
         """Block the connection."""
         self._transition_state(self.STATE_BLOCKED)
-        self.save()
     
     @classmethod
     def get_connection(cls, user1, user2):
         """
         Get any accepted connection between two users.
         Returns the connection request object if accepted, None otherwise.
+        
+        Looks the pair up on Connection, which stores it with user1_id < user2_id,
+        so it is a single probe of the (user1, user2) unique index rather than an
+        OR over both (sender, receiver) directions.
         """
-        try:
-            # Check if there's an accepted connection in either direction
-            request = cls.objects.filter(
-                models.Q(sender=user1, receiver=user2) | models.Q(sender=user2, receiver=user1),
-                state=cls.STATE_ACCEPTED
-            ).first()
-            return request
-        except cls.DoesNotExist:
-            return None
+        user1_id, user2_id = sorted([user1.id, user2.id])
+        connection = Connection.objects.filter(
+            user1_id=user1_id,
+            user2_id=user2_id,
+            connection_request__state=cls.STATE_ACCEPTED
+        ).select_related('connection_request').first()
+        return connection.connection_request if connection else None
     
     def is_connected(self):
         """Check if this connection is accepted (users are connected)."""
@@ -181,6 +207,12 @@ class Connection(models.Model):
     class Meta:
         db_table = 'connections'
         unique_together = [['user1', 'user2']]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(user1__lt=models.F('user2')),
+                name='chk_conn_user_order'
+            ),
+        ]
         indexes = [
             models.Index(fields=['user1', 'created_at'], name='idx_conn_user1_created'),
             models.Index(fields=['user2', 'created_at'], name='idx_conn_user2_created'),
@@ -192,30 +224,25 @@ class Connection(models.Model):
     def __str__(self):
         return f"{self.user1.full_name} <-> {self.user2.full_name}"
     
-    def clean(self):
-        """Ensure user1_id < user2_id for consistency."""
-        if hasattr(self, 'user1') and hasattr(self, 'user2'):
-            if self.user1.id > self.user2.id:
-                self.user1, self.user2 = self.user2, self.user1
-    
-    def save(self, *args, **kwargs):
-        """Override save to run validation."""
-        self.clean()
-        super().save(*args, **kwargs)
-    
     @classmethod
     def create_from_request(cls, connection_request):
         """Create a Connection record from an accepted ConnectionRequest."""
-        user1, user2 = connection_request.sender, connection_request.receiver
-        
-        # Ensure user1_id < user2_id for consistency
-        if user1.id > user2.id:
-            user1, user2 = user2, user1
+        # Store the pair as user1_id < user2_id (enforced by chk_conn_user_order)
+        user1_id, user2_id = sorted([
+            connection_request.sender_id,
+            connection_request.receiver_id,
+        ])
         
         connection, created = cls.objects.get_or_create(
-            user1=user1,
-            user2=user2,
+            user1_id=user1_id,
+            user2_id=user2_id,
             defaults={'connection_request': connection_request}
         )
         
+        # A pair that reconnects (e.g. after a block) keeps its row; point it at
+        # the newly accepted request so get_connection() sees the current state
+        if not created and connection.connection_request_id != connection_request.pk:
+            connection.connection_request = connection_request
+            connection.save(update_fields=['connection_request'])
+        
         return connection, created
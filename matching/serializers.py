@@ -64,25 +64,24 @@ class ConnectionRequestSerializer(serializers.ModelSerializer):
             'rejected_at',
         ]
     
-    def get_can_accept(self, obj):
-        """Check if the current user can accept this request."""
+    def _is_pending_for_receiver(self, obj):
+        """Whether the current user is the receiver of this still-pending request."""
         request = self.context.get('request')
         if request and request.user:
+            # Compare raw ids so the receiver row is never loaded
             return (
-                obj.receiver == request.user and
+                obj.receiver_id == request.user.id and
                 obj.state == ConnectionRequest.STATE_PENDING
             )
         return False
     
+    def get_can_accept(self, obj):
+        """Check if the current user can accept this request."""
+        return self._is_pending_for_receiver(obj)
+    
     def get_can_reject(self, obj):
         """Check if the current user can reject this request."""
-        request = self.context.get('request')
-        if request and request.user:
-            return (
-                obj.receiver == request.user and
-                obj.state == ConnectionRequest.STATE_PENDING
-            )
-        return False
+        return self._is_pending_for_receiver(obj)
     
     def get_can_message(self, obj):
         """Check if users can message each other."""
@@ -102,16 +101,14 @@ class SendConnectionRequestSerializer(serializers.Serializer):
     
     def validate_receiver_id(self, value):
         """Validate that receiver exists and is not the sender."""
-        try:
-            receiver = User.objects.get(id=value)
-        except User.DoesNotExist:
-            raise serializers.ValidationError("Receiver user does not exist")
-        
         # Check if sender is trying to send to themselves
         request = self.context.get('request')
         if request and request.user.id == value:
             raise serializers.ValidationError("Cannot send connection request to yourself")
         
+        if not User.objects.filter(pk=value).exists():
+            raise serializers.ValidationError("Receiver user does not exist")
+        
         return value
     
     def validate(self, data):
@@ -122,18 +119,18 @@ class SendConnectionRequestSerializer(serializers.Serializer):
         
         # Check if request already exists
         receiver_id = data.get('receiver_id')
-        existing = ConnectionRequest.objects.filter(
+        existing_state = ConnectionRequest.objects.filter(
             sender=request.user,
             receiver_id=receiver_id,
             state__in=[
                 ConnectionRequest.STATE_PENDING,
                 ConnectionRequest.STATE_ACCEPTED,
             ]
-        ).first()
+        ).values_list('state', flat=True).first()
         
-        if existing:
+        if existing_state:
             raise serializers.ValidationError(
-                f"Connection request already exists with status: {existing.state}"
+                f"Connection request already exists with status: {existing_state}"
             )
         
         return data
@@ -175,12 +172,10 @@ class ConnectionSerializer(serializers.ModelSerializer):
 
 
 class ConnectionRequestListSerializer(serializers.ModelSerializer):
-    """Simplified serializer for listing connection requests."""
-    
-    sender_name = serializers.CharField(source='sender.full_name', read_only=True)
-    sender_avatar = serializers.URLField(source='sender.avatar_url', read_only=True)
-    receiver_name = serializers.CharField(source='receiver.full_name', read_only=True)
-    receiver_avatar = serializers.URLField(source='receiver.avatar_url', read_only=True)
+    """
+    Simplified serializer for listing connection requests.
+    Names and avatars come from the columns denormalized onto the request.
+    """
     
     class Meta:
         model = ConnectionRequest
@@ -245,19 +240,14 @@ class AcceptedConnectionSerializer(serializers.Serializer):
         
         user_serializer = UserBasicSerializer(other_user)
         
-        # Get conversation_id if exists
-        conversation_id = None
-        try:
-            # Try to get connection and its conversation
-            from matching.models import Connection
-            connection = Connection.objects.filter(
+        # Annotated by ConnectionService.get_accepted_connections(); a single
+        # fetched request falls back to one lookup
+        if hasattr(instance, 'conversation_id'):
+            conversation_id = instance.conversation_id
+        else:
+            conversation_id = Connection.objects.filter(
                 connection_request=instance
-            ).select_related('conversation').first()
-            
-            if connection and hasattr(connection, 'conversation'):
-                conversation_id = connection.conversation.id
-        except Exception:
-            pass
+            ).values_list('conversation__id', flat=True).first()
         
         return {
             'id': instance.id,
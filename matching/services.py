@@ -4,13 +4,38 @@ Service layer for matching app with Redis caching.
 from django.core.cache import cache
 from django.conf import settings
 from django.db import transaction
-from django.db.models import Q
+from django.db.models import Count, OuterRef, Q, Subquery
 from typing import List, Optional, Dict, Any
 import json
 
 from .models import ConnectionRequest, Connection
 
 
+# Columns read by UserBasicSerializer, for .only() projections through a relation
+USER_BASIC_FIELDS = ('id', 'email', 'full_name', 'avatar_url', 'school', 'major', 'year', 'bio')
+
+# Columns read by ConnectionRequestListSerializer
+CONNECTION_REQUEST_LIST_FIELDS = (
+    'id', 'state', 'message', 'created_at',
+    'sender_name', 'sender_avatar', 'receiver_name', 'receiver_avatar',
+)
+
+# Columns read by AcceptedConnectionSerializer
+ACCEPTED_CONNECTION_FIELDS = (
+    'id', 'state', 'accepted_at',
+    *(f'sender__{field}' for field in USER_BASIC_FIELDS),
+    *(f'receiver__{field}' for field in USER_BASIC_FIELDS),
+)
+
+# Conversation of an accepted request's connection, read by
+# AcceptedConnectionSerializer instead of a lookup per row
+CONVERSATION_ID_SUBQUERY = Subquery(
+    Connection.objects.filter(
+        connection_request=OuterRef('pk')
+    ).values('conversation__id')[:1]
+)
+
+
 class ConnectionCacheService:
     """Service for caching connection request data in Redis."""
     
@@ -142,7 +167,7 @@ class ConnectionService:
         existing = ConnectionRequest.objects.filter(
             sender=sender,
             receiver=receiver
-        ).first()
+        ).select_related('sender', 'receiver').first()
         
         if existing:
             if existing.state == ConnectionRequest.STATE_REJECTED:
@@ -182,7 +207,6 @@ class ConnectionService:
         """
         # Accept the request
         request.accept()
-        request.save()
         
         # Create Connection immediately (bidirectional)
         connection, created = Connection.create_from_request(request)
@@ -203,7 +227,6 @@ class ConnectionService:
     def reject_connection_request(cls, request: ConnectionRequest) -> ConnectionRequest:
         """Reject a connection request."""
         request.reject()
-        request.save()
         
         # Invalidate caches
         ConnectionCacheService.invalidate_user_caches(
@@ -217,7 +240,6 @@ class ConnectionService:
     def block_connection(cls, request: ConnectionRequest) -> ConnectionRequest:
         """Block a connection."""
         request.block()
-        request.save()
         
         # Invalidate caches
         ConnectionCacheService.invalidate_user_caches(
@@ -260,7 +282,7 @@ class ConnectionService:
         if state:
             queryset = queryset.filter(state=state)
         
-        queryset = queryset.select_related('receiver').order_by('-created_at')
+        queryset = queryset.only(*CONNECTION_REQUEST_LIST_FIELDS).order_by('-created_at')
         
         return queryset
     
@@ -282,7 +304,7 @@ class ConnectionService:
         if state:
             queryset = queryset.filter(state=state)
         
-        queryset = queryset.select_related('sender').order_by('-created_at')
+        queryset = queryset.only(*CONNECTION_REQUEST_LIST_FIELDS).order_by('-created_at')
         
         return queryset
     
@@ -302,7 +324,11 @@ class ConnectionService:
         queryset = ConnectionRequest.objects.filter(
             Q(sender=user) | Q(receiver=user),
             state=ConnectionRequest.STATE_ACCEPTED
-        ).select_related('sender', 'receiver').order_by('-accepted_at')
+        ).select_related('sender', 'receiver').only(
+            *ACCEPTED_CONNECTION_FIELDS
+        ).annotate(
+            conversation_id=CONVERSATION_ID_SUBQUERY
+        ).order_by('-accepted_at')
         
         return queryset
     
@@ -361,21 +387,21 @@ class ConnectionService:
     @classmethod
     def get_connection_statistics(cls, user) -> Dict[str, int]:
         """Get connection statistics for a user."""
+        # Both pending counts in one conditional aggregate
+        pending = ConnectionRequest.objects.filter(
+            Q(sender=user) | Q(receiver=user),
+            state=ConnectionRequest.STATE_PENDING
+        ).aggregate(
+            sent_pending=Count('pk', filter=Q(sender=user)),
+            received_pending=Count('pk', filter=Q(receiver=user)),
+        )
+        sent_pending = pending['sent_pending']
+        received_pending = pending['received_pending']
+        
         # Try cache first
-        cached_count = ConnectionCacheService.get_connection_count(user.id)
+        connection_count = ConnectionCacheService.get_connection_count(user.id)
         
-        if cached_count is None:
-            # Calculate from database
-            sent_pending = ConnectionRequest.objects.filter(
-                sender=user,
-                state=ConnectionRequest.STATE_PENDING
-            ).count()
-            
-            received_pending = ConnectionRequest.objects.filter(
-                receiver=user,
-                state=ConnectionRequest.STATE_PENDING
-            ).count()
-            
+        if connection_count is None:
             # Count connections from Connection table (bidirectional)
             connection_count = Connection.objects.filter(
                 Q(user1=user) | Q(user2=user)
@@ -383,18 +409,6 @@ class ConnectionService:
             
             # Cache the connection count
             ConnectionCacheService.set_connection_count(user.id, connection_count)
-        else:
-            sent_pending = ConnectionRequest.objects.filter(
-                sender=user,
-                state=ConnectionRequest.STATE_PENDING
-            ).count()
-            
-            received_pending = ConnectionRequest.objects.filter(
-                receiver=user,
-                state=ConnectionRequest.STATE_PENDING
-            ).count()
-            
-            connection_count = cached_count
         
         return {
             'sent_pending': sent_pending,
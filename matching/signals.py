@@ -0,0 +1,33 @@
+"""
+Signal handlers for matching app.
+"""
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import ConnectionRequest
+
+
+User = get_user_model()
+
+# User fields denormalized onto ConnectionRequest
+SNAPSHOT_FIELDS = {'full_name', 'avatar_url'}
+
+
+@receiver(post_save, sender=User)
+def sync_connection_request_users(sender, instance, created, update_fields=None, **kwargs):
+    """Refresh the sender/receiver names and avatars stored on connection requests."""
+    if created:
+        return
+    if update_fields is not None and not SNAPSHOT_FIELDS.intersection(update_fields):
+        return
+    
+    # Only rewrite the rows that are actually out of date
+    ConnectionRequest.objects.filter(sender=instance).exclude(
+        sender_name=instance.full_name,
+        sender_avatar=instance.avatar_url
+    ).update(sender_name=instance.full_name, sender_avatar=instance.avatar_url)
+    ConnectionRequest.objects.filter(receiver=instance).exclude(
+        receiver_name=instance.full_name,
+        receiver_avatar=instance.avatar_url
+    ).update(receiver_name=instance.full_name, receiver_avatar=instance.avatar_url)
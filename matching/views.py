@@ -22,13 +22,25 @@ from .serializers import (
     ConnectionStatisticsSerializer,
     AcceptedConnectionSerializer,
 )
-from .services import ConnectionService
+from .services import CONNECTION_REQUEST_LIST_FIELDS, ConnectionService
 from . import schema
 
 
 User = get_user_model()
 
 
+def get_connection_request_or_404(pk, **filters):
+    """
+    Fetch a connection request with its sender and receiver joined in, as the
+    permission checks, the services and the serializers all read both users.
+    """
+    return get_object_or_404(
+        ConnectionRequest.objects.select_related('sender', 'receiver'),
+        pk=pk,
+        **filters
+    )
+
+
 class ConnectionRequestViewSet(viewsets.GenericViewSet):
     """
     ViewSet for managing connection requests.
@@ -65,7 +77,7 @@ class ConnectionRequestViewSet(viewsets.GenericViewSet):
         user = self.request.user
         return ConnectionRequest.objects.filter(
             models.Q(sender=user) | models.Q(receiver=user)
-        ).select_related('sender', 'receiver').order_by('-created_at')
+        ).only(*CONNECTION_REQUEST_LIST_FIELDS).order_by('-created_at')
     
     @extend_schema(
         request=SendConnectionRequestSerializer,
@@ -106,10 +118,7 @@ class ConnectionRequestViewSet(viewsets.GenericViewSet):
     )
     def retrieve(self, request, pk=None):
         """Get details of a specific connection request."""
-        connection_request = get_object_or_404(
-            ConnectionRequest,
-            pk=pk
-        )
+        connection_request = get_connection_request_or_404(pk)
         
         # Check permission - only sender or receiver can view
         if connection_request.sender != request.user and connection_request.receiver != request.user:
@@ -158,7 +167,7 @@ class ConnectionRequestViewSet(viewsets.GenericViewSet):
     @action(detail=True, methods=['post'])
     def accept(self, request, pk=None):
         """Accept a connection request."""
-        connection_request = get_object_or_404(ConnectionRequest, pk=pk)
+        connection_request = get_connection_request_or_404(pk)
         
         # Only receiver can accept
         if connection_request.receiver != request.user:
@@ -194,7 +203,7 @@ class ConnectionRequestViewSet(viewsets.GenericViewSet):
     @action(detail=True, methods=['post'])
     def reject(self, request, pk=None):
         """Reject a connection request."""
-        connection_request = get_object_or_404(ConnectionRequest, pk=pk)
+        connection_request = get_connection_request_or_404(pk)
         
         # Only receiver can reject
         if connection_request.receiver != request.user:
@@ -228,7 +237,7 @@ class ConnectionRequestViewSet(viewsets.GenericViewSet):
     @action(detail=True, methods=['post'])
     def block(self, request, pk=None):
         """Block a connection."""
-        connection_request = get_object_or_404(ConnectionRequest, pk=pk)
+        connection_request = get_connection_request_or_404(pk)
         
         # Only participants can block
         if connection_request.sender != request.user and connection_request.receiver != request.user:
@@ -257,7 +266,7 @@ class ConnectionRequestViewSet(viewsets.GenericViewSet):
         Cancel/delete a sent connection request.
         Only the sender can cancel their own pending requests.
         """
-        connection_request = get_object_or_404(ConnectionRequest, pk=pk)
+        connection_request = get_connection_request_or_404(pk)
         
         # Only sender can cancel their own request
         if connection_request.sender != request.user:
@@ -437,9 +446,8 @@ class ConnectionViewSet(viewsets.ReadOnlyModelViewSet):
     def retrieve(self, request, pk=None):
         """Get details of a specific connection."""
         # Get the connection request
-        connection_request = get_object_or_404(
-            ConnectionRequest,
-            pk=pk,
+        connection_request = get_connection_request_or_404(
+            pk,
             state=ConnectionRequest.STATE_ACCEPTED
         )
         
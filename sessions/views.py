@@ -5,6 +5,7 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.pagination import PageNumberPagination
 from django.shortcuts import get_object_or_404
 from django.db import models, transaction
 from django.utils import timezone
@@ -333,18 +334,16 @@ class StudySessionViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=['get'])
     def participants(self, request, pk=None):
         """List session participants with pagination."""
-        from rest_framework.pagination import PageNumberPagination
-        
         session = self.get_object()
         participants = session.participants.select_related('user').order_by('joined_at')
 
-        # Create paginator instance
+        # Create paginator instance (page_size is parsed and capped by DRF)
         paginator = PageNumberPagination()
-        paginator.page_size = int(request.query_params.get('page_size', 12))
+        paginator.page_size_query_param = 'page_size'
         paginator.max_page_size = 100
-        
+
         # Paginate the queryset
-        page = paginator.paginate_queryset(participants, request)
+        page = paginator.paginate_queryset(participants, request, view=self)
         if page is not None:
             serializer = SessionParticipantSerializer(
                 page,
@@ -11,6 +11,7 @@ from django.contrib.gis.db.models.functions import Distance
 from django.contrib.gis.measure import D
 from django.db.models import Q
 
+from locations.functions import distance_km, point_latitude, point_longitude
 from locations.models import LocationHistory
 from users.models import User
 from users.serializers import (
@@ -252,8 +253,11 @@ class NearbyLearnersView(generics.ListAPIView):
             id__in=connection_request_user_ids
         ).filter(
             geom_last_point__dwithin=(user.geom_last_point, D(km=radius_km))
-        ).annotate(
-            distance=Distance('geom_last_point', user.geom_last_point)
+        ).select_related('school').defer('geom_last_point').annotate(
+            distance=Distance('geom_last_point', user.geom_last_point),
+            distance_km=distance_km('distance'),
+            latitude=point_latitude('geom_last_point'),
+            longitude=point_longitude('geom_last_point')
         ).order_by('distance')
         
         return nearby_users
@@ -275,28 +279,11 @@ class NearbyLearnersView(generics.ListAPIView):
         # Get the queryset
         queryset = self.filter_queryset(self.get_queryset())
         
-        # Paginate the queryset
+        # distance_km, latitude and longitude are annotated in SQL, so rows
+        # are serialized straight from the queryset
         page = self.paginate_queryset(queryset)
         if page is not None:
-            # Convert queryset to data with distance
-            learners_data = []
-            for nearby_user in page:
-                learner_data = {
-                    'id': nearby_user.id,
-                    'email': nearby_user.email,
-                    'full_name': nearby_user.full_name,
-                    'avatar_url': nearby_user.avatar_url,
-                    'bio': nearby_user.bio,
-                    'school': nearby_user.school,
-                    'major': nearby_user.major,
-                    'year': nearby_user.year,
-                    'distance_km': round(nearby_user.distance.km, 2),
-                    'latitude': nearby_user.geom_last_point.y,
-                    'longitude': nearby_user.geom_last_point.x,
-                }
-                learners_data.append(learner_data)
-            
-            serializer = self.get_serializer(learners_data, many=True)
+            serializer = self.get_serializer(page, many=True)
             
             # Get paginated response
             paginated_response = self.get_paginated_response(serializer.data)
@@ -307,28 +294,11 @@ class NearbyLearnersView(generics.ListAPIView):
             return paginated_response
         
         # Non-paginated response (shouldn't happen with default settings)
-        learners_data = []
-        for nearby_user in queryset:
-            learner_data = {
-                'id': nearby_user.id,
-                'email': nearby_user.email,
-                'full_name': nearby_user.full_name,
-                'avatar_url': nearby_user.avatar_url,
-                'bio': nearby_user.bio,
-                'school': nearby_user.school,
-                'major': nearby_user.major,
-                'year': nearby_user.year,
-                'distance_km': round(nearby_user.distance.km, 2),
-                'latitude': nearby_user.geom_last_point.y,
-                'longitude': nearby_user.geom_last_point.x,
-            }
-            learners_data.append(learner_data)
-        
-        serializer = self.get_serializer(learners_data, many=True)
+        serializer = self.get_serializer(queryset, many=True)
         
         return Response({
             'radius_km': getattr(self, '_radius_km', user.learning_radius_km),
-            'count': len(learners_data),
+            'count': len(serializer.data),
             'results': serializer.data
         }, status=status.HTTP_200_OK)
 